@@ -0,0 +1,96 @@
+"""
+================================================================================
+DATA LOADING MODULE
+================================================================================
+
+Shared, cached loader for the primary dataset (ml_final_100pct_geometry),
+plus the categorical filter helper the pages use on it.
+
+Pages import the loader from here instead of defining their own copy, so
+Streamlit keeps a single cache entry for the dataset that every page
+reuses across navigations.
+
+Usage:
+    from data_loader import load_main_dataset, category_code_mask
+
+    df = load_main_dataset()
+    in_regions = category_code_mask(df['region'], ['NORD', 'EST'])
+
+================================================================================
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import streamlit as st
+
+from lang_config import get_text
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Typed Parquet sibling written by prepare_parquet.py; CSV is the fallback
+PARQUET_PATH = 'cleaned_data/ml_final_100pct_geometry.parquet'
+CSV_PATH = 'cleaned_data/ml_final_100pct_geometry.csv'
+
+# Dtypes applied when parsing the CSV (stored in the Parquet schema)
+DTYPES = {
+    'data_year': 'int16',
+    'week_number': 'int8',
+    'region': 'category',
+    'district_clean': 'category'
+}
+
+
+# ============================================================================
+# CACHED DATA LOADING
+# ============================================================================
+
+@st.cache_resource(ttl=3600)
+def load_main_dataset():
+    """
+    Load primary dataset (Parquet, falling back to the CSV)
+
+    Cached as a shared resource: every caller gets the same DataFrame
+    without a pickle round-trip, so callers must not modify it in place
+    (take a .copy() before assigning columns).
+    """
+    try:
+        if os.path.exists(PARQUET_PATH):
+            # Memory-mapped Arrow read; columns are handed to pandas without
+            # consolidating them into 2-D blocks, releasing Arrow buffers as
+            # each column is converted
+            table = pq.read_table(PARQUET_PATH, memory_map=True)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+
+        return pd.read_csv(CSV_PATH, dtype=DTYPES)
+    except Exception as e:
+        lang = st.session_state.get('language', 'en')
+        st.error(f"{get_text('error_loading_data', lang)}: {str(e)}")
+        return pd.DataFrame()
+
+
+# ============================================================================
+# FILTER HELPERS
+# ============================================================================
+
+def category_code_mask(values, selected):
+    """
+    Boolean mask of rows whose categorical value is in selected
+
+    Compares the integer category codes instead of hashing the strings.
+
+    Args:
+        values: Categorical Series or CategoricalIndex (e.g. region,
+            district_clean)
+        selected: Iterable of category labels to keep
+
+    Returns:
+        NumPy boolean array aligned with values
+    """
+    cat = values.array
+    sel_codes = cat.categories.get_indexer(list(selected))
+    return np.isin(cat.codes, sel_codes[sel_codes >= 0])
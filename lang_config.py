@@ -18,6 +18,8 @@ Usage:
 ================================================================================
 """
 
+from functools import lru_cache
+
 # ============================================================================
 # TRANSLATION DICTIONARY
 # ============================================================================
@@ -960,9 +962,10 @@ translations = {
 # HELPER FUNCTION
 # ============================================================================
 
+@lru_cache(maxsize=2048)
 def get_text(key, language='en'):
     """
-    Get translated text for a given key.
+    Get translated text for a given key (memoized per key/language).
     
     Args:
         key: Translation key
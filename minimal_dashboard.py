@@ -89,6 +89,27 @@ def load_meningitis_data():
         st.error(" Data file not found! Please update the file path in load_meningitis_data()")
         return pd.DataFrame()
 
+
+# ============================================================================
+# RATE HELPERS
+# ============================================================================
+
+def safe_rate(num, den, scale=100.0):
+    """Scalar rate (num / den * scale), 0 when the denominator is 0"""
+    return float(num) * scale / float(den) if den else 0.0
+
+
+def safe_rate_series(num, den, scale=100.0):
+    """
+    Vectorized rate for Series: one masked np.divide instead of
+    replace(0, 1) + divide + multiply
+    """
+    den_arr = den.to_numpy(dtype=np.float64)
+    out = np.zeros(len(den_arr))
+    np.divide(num.to_numpy(dtype=np.float64), den_arr, out=out, where=den_arr > 0)
+    return out * scale
+
+
 # Load data
 df = load_meningitis_data()
 
@@ -167,7 +188,7 @@ kpi_col1, kpi_col2, kpi_col3, kpi_col4, kpi_col5 = st.columns(5)
 # Calculate KPIs
 total_cases = filtered_df['cases'].sum()
 total_deaths = filtered_df['deaths'].sum()
-overall_cfr = (total_deaths / total_cases * 100) if total_cases > 0 else 0
+overall_cfr = safe_rate(total_deaths, total_cases)
 affected_districts = filtered_df[filtered_df['cases'] > 0]['district'].nunique()
 total_districts = filtered_df['district'].nunique()
 
@@ -221,7 +242,7 @@ yearly_summary = filtered_df.groupby('data_year').agg({
     'deaths': 'sum'
 }).reset_index()
 
-yearly_summary['cfr'] = (yearly_summary['deaths'] / yearly_summary['cases'].replace(0, 1) * 100)
+yearly_summary['cfr'] = safe_rate_series(yearly_summary['deaths'], yearly_summary['cases'])
 
 # Create dual-axis plot
 fig_temporal = go.Figure()
@@ -344,7 +365,7 @@ with col_left:
     }).reset_index()
     
     regional_summary.columns = ['region', 'total_cases', 'total_deaths', 'num_districts']
-    regional_summary['cfr'] = (regional_summary['total_deaths'] / regional_summary['total_cases'].replace(0, 1) * 100)
+    regional_summary['cfr'] = safe_rate_series(regional_summary['total_deaths'], regional_summary['total_cases'])
     regional_summary = regional_summary.sort_values('total_cases', ascending=True)
     
     # Horizontal bar chart
@@ -399,7 +420,7 @@ district_summary = filtered_df.groupby(['region', 'district']).agg({
 }).reset_index()
 
 district_summary['incidence_rate'] = (district_summary['cases'] / district_summary['population'] * 100000).round(2)
-district_summary['cfr'] = (district_summary['deaths'] / district_summary['cases'].replace(0, 1) * 100).round(2)
+district_summary['cfr'] = safe_rate_series(district_summary['deaths'], district_summary['cases']).round(2)
 
 top_15_districts = district_summary.nlargest(15, 'cases')
 
@@ -25,6 +25,10 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import io
+import json
+import matplotlib
+from matplotlib.colors import Normalize, to_hex
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -33,6 +37,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lang_config import get_text
+from data_loader import category_code_mask
 
 # Try to import geopandas (optional - for advanced mapping)
 try:
@@ -75,17 +80,40 @@ st.markdown("""
 # CACHED DATA LOADING
 # ============================================================================
 
+# Typed Parquet sibling written by prepare_parquet.py; CSV is the fallback
+PARQUET_PATH = 'cleaned_data/ml_final_100pct_geometry.parquet'
+CSV_PATH = 'cleaned_data/ml_final_100pct_geometry.csv'
+
+# District polygons simplified as a coverage by prepare_parquet.py (shared
+# borders kept intact); the full-resolution file is the fallback
+GEOJSON_PATH = 'cleaned_data/cameroon_districts_matched.geojson'
+SIMPLIFIED_GEOJSON_PATH = 'cleaned_data/cameroon_districts_simplified.geojson'
+
+# Columns consumed by this page and their dtypes (applied at parse time)
+USED_COLS = ['data_year', 'week_number', 'region', 'district_clean',
+             'cases', 'deaths', 'population']
+DTYPES = {
+    'data_year': 'int16',
+    'week_number': 'int8',
+    'region': 'category',
+    'district_clean': 'category'
+}
+
+
 @st.cache_data(ttl=3600)
 def load_main_dataset():
-    """Load primary dataset"""
+    """Load primary dataset (Parquet, falling back to the CSV)"""
     try:
-        df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-        df['data_year'] = df['data_year'].astype('int16')
-        df['week_number'] = df['week_number'].astype('int8')
-        if 'region' in df.columns:
-            df['region'] = df['region'].astype('category')
-        if 'district_clean' in df.columns:
-            df['district_clean'] = df['district_clean'].astype('category')
+        if os.path.exists(PARQUET_PATH):
+            # Dtypes are stored in the Parquet schema
+            return pd.read_parquet(PARQUET_PATH, columns=USED_COLS)
+        
+        df = pd.read_csv(
+            CSV_PATH,
+            engine='pyarrow',
+            usecols=USED_COLS,
+            dtype=DTYPES
+        )
         return df
     except Exception as e:
         st.error(f"{get_text('error_loading_data', lang)}: {str(e)}")
@@ -97,14 +125,27 @@ def load_geojson():
     """
     Load GeoJSON file with district geometries
     
-    This file contains the geographic boundaries for mapping
+    This file contains the geographic boundaries for mapping.
+    Returned as a plain GeoJSON dict (features keyed by
+    properties.district_clean) so Plotly never re-serializes
+    Shapely geometries on a render.
     """
     if not GEOPANDAS_AVAILABLE:
         return None
     
     try:
-        gdf = gpd.read_file('cleaned_data/cameroon_districts_matched.geojson')
-        return gdf
+        if os.path.exists(SIMPLIFIED_GEOJSON_PATH):
+            with open(SIMPLIFIED_GEOJSON_PATH, encoding='utf-8') as f:
+                return json.load(f)
+        
+        # Only the join key is needed; skip the other feature attributes
+        gdf = gpd.read_file(GEOJSON_PATH, columns=['district_clean'])[['district_clean', 'geometry']]
+        
+        # Per-polygon simplification: small tolerance, since shared borders
+        # are simplified independently on each side (slivers grow with it)
+        gdf['geometry'] = gdf.geometry.simplify(tolerance=0.005, preserve_topology=True)
+        
+        return json.loads(gdf.to_json())
     except FileNotFoundError:
         st.warning(f"⚠️ {get_text('failed_load_geojson', lang)}")
         return None
@@ -113,40 +154,63 @@ def load_geojson():
         return None
 
 
+@st.cache_data(ttl=3600)
+def load_district_cube():
+    """
+    Aggregate the whole dataset once per (year, region, district)
+    
+    Returns:
+        DataFrame indexed by ['data_year', 'region', 'district_clean']
+        with summed cases/deaths and the first population value
+    """
+    df = load_main_dataset()
+    return df.groupby(
+        ['data_year', 'region', 'district_clean'], observed=True, sort=False
+    ).agg({
+        'cases': 'sum',
+        'deaths': 'sum',
+        'population': 'first'
+    })
+
+
 @st.cache_data
-def prepare_spatial_data(df, selected_year, selected_regions):
+def prepare_spatial_data(selected_year: int, selected_regions: tuple):
     """
     Prepare district-level spatial data for mapping
     
+    Keyed on scalars only; the dataset comes from the cached loader
+    instead of being hashed as an argument on every call.
+    
     Args:
-        df: Main dataframe
         selected_year: Single year to display
-        selected_regions: List of regions to include
+        selected_regions: Sorted tuple of regions to include
         
     Returns:
         DataFrame with district-level aggregates
     """
-    # Filter for selected year and regions
-    df_filtered = df[
-        (df['data_year'] == selected_year) &
-        (df['region'].isin(selected_regions))
-    ].copy()
-    
-    # Aggregate by district
-    district_summary = df_filtered.groupby(['region', 'district_clean']).agg({
-        'cases': 'sum',
-        'deaths': 'sum',
-        'population': 'first'
-    }).reset_index()
-    
-    # Calculate metrics
-    district_summary['incidence_rate'] = (
-        district_summary['cases'] / district_summary['population'] * 100000
-    ).fillna(0)
-    
-    district_summary['cfr'] = (
-        district_summary['deaths'] / district_summary['cases'].replace(0, np.nan) * 100
-    ).fillna(0)
+    # Slice the precomputed cube for the selected year and regions
+    year_cube = load_district_cube().xs(selected_year, level='data_year')
+    district_summary = year_cube[
+        category_code_mask(year_cube.index.get_level_values('region'), selected_regions)
+    ].reset_index()
+    
+    # Calculate metrics (masked divisions, 0 where the denominator is 0)
+    cases = district_summary['cases'].to_numpy(dtype=np.float64)
+    deaths = district_summary['deaths'].to_numpy(dtype=np.float64)
+    pop = district_summary['population'].to_numpy(dtype=np.float64)
+    
+    inc = np.zeros_like(pop)
+    np.divide(cases, pop, out=inc, where=pop > 0)
+    inc *= 1e5
+    district_summary['incidence_rate'] = inc
+    
+    cfr = np.zeros_like(cases)
+    np.divide(deaths, cases, out=cfr, where=cases > 0)
+    cfr *= 100
+    district_summary['cfr'] = cfr
+    
+    # Display-precision rates (2 decimals) fit comfortably in float32
+    district_summary[['incidence_rate', 'cfr']] = district_summary[['incidence_rate', 'cfr']].astype('float32')
     
     # Sort by cases
     district_summary = district_summary.sort_values('cases', ascending=False)
@@ -154,6 +218,87 @@ def prepare_spatial_data(df, selected_year, selected_regions):
     return district_summary
 
 
+@st.cache_data(ttl=3600)
+def build_map_frame(selected_year, selected_regions):
+    """
+    Map-ready frame: one row per GeoJSON district with all four metrics
+    
+    The district aggregates are left-joined onto the GeoJSON feature ids
+    and missing metrics filled with 0, so districts without rows for the
+    selection (unselected regions, no reports that year) are still drawn.
+    Keyed only on (year, sorted regions tuple), so switching the metric
+    radio is a cache hit and only the choropleth call itself reruns.
+    
+    Args:
+        selected_year: Single year to display
+        selected_regions: Sorted tuple of regions to include
+        
+    Returns:
+        DataFrame with district_clean, region, cases, deaths,
+        incidence_rate and cfr
+    """
+    geojson = load_geojson()
+    map_districts = pd.Index(
+        [feature['properties']['district_clean'] for feature in geojson['features']],
+        name='district_clean'
+    )
+    
+    district_data = prepare_spatial_data(selected_year, selected_regions)
+    metrics = district_data.set_index(district_data['district_clean'].astype(str))[
+        ['cases', 'deaths', 'incidence_rate', 'cfr']
+    ]
+    map_data = metrics.reindex(map_districts).fillna(0)
+    
+    # Region of every district (from any year), for the hover of unmatched ones
+    cube_index = load_district_cube().index
+    district_region = pd.Series(
+        cube_index.get_level_values('region').astype(str),
+        index=cube_index.get_level_values('district_clean').astype(str)
+    )
+    district_region = district_region[~district_region.index.duplicated()]
+    map_data.insert(0, 'region', district_region.reindex(map_districts).fillna('').to_numpy())
+    
+    return map_data.reset_index()
+
+
+# ============================================================================
+# TABLE STYLING
+# ============================================================================
+
+def gradient_styles(df, column_cmaps):
+    """
+    Precompute background-gradient CSS for several columns in one pass
+    
+    Mirrors Styler.background_gradient (min-max normalisation, white text
+    on dark cells) but builds every cell style at once, so the table is
+    styled with a single Styler.apply instead of one pass per column.
+    
+    Args:
+        df: Display dataframe
+        column_cmaps: Dict of {column: matplotlib colormap name}
+        
+    Returns:
+        DataFrame of CSS strings shaped like df
+    """
+    styles = pd.DataFrame('', index=df.index, columns=df.columns)
+    
+    for col, cmap_name in column_cmaps.items():
+        values = df[col].to_numpy(dtype=np.float64)
+        rgba = matplotlib.colormaps[cmap_name](Normalize(values.min(), values.max())(values))
+        
+        # Relative luminance decides the text colour, as pandas does
+        rgb = np.where(rgba[:, :3] <= 0.03928, rgba[:, :3] / 12.92,
+                       ((rgba[:, :3] + 0.055) / 1.055) ** 2.4)
+        luminance = rgb @ np.array([0.2126, 0.7152, 0.0722])
+        
+        styles[col] = [
+            f"background-color: {to_hex(c)}; color: {'#f1f1f1' if lum < 0.408 else '#000000'};"
+            for c, lum in zip(rgba, luminance)
+        ]
+    
+    return styles
+
+
 # ============================================================================
 # MAIN PAGE FUNCTION
 # ============================================================================
@@ -164,6 +309,15 @@ def main():
     # Get language
     lang = st.session_state.get('language', 'en')
     
+    # Labels reused throughout the page
+    cases_label = get_text('cases', lang)
+    deaths_label = get_text('deaths', lang)
+    region_label = get_text('region', lang)
+    district_label = get_text('district', lang)
+    total_cases_label = get_text('total_cases', lang)
+    total_deaths_label = get_text('total_deaths', lang)
+    cfr_label = f"{get_text('case_fatality_rate', lang)} (%)"
+    
     # ========================================================================
     # HEADER
     # ========================================================================
@@ -180,7 +334,7 @@ def main():
     
     with st.spinner(f"{get_text('loading_data', lang)}"):
         df = load_main_dataset()
-        gdf = load_geojson() if GEOPANDAS_AVAILABLE else None
+        geojson = load_geojson() if GEOPANDAS_AVAILABLE else None
     
     if df.empty:
         st.error(f"❌ {get_text('failed_load_data', lang)}")
@@ -225,10 +379,10 @@ def main():
     
     # Metric options with translations
     metric_options = {
-        get_text('total_cases', lang): 'cases',
+        total_cases_label: 'cases',
         f"{get_text('incidence_rate', lang)} ({get_text('per_100k', lang)})": 'incidence_rate',
-        f"{get_text('case_fatality_rate', lang)} (%)": 'cfr',
-        get_text('total_deaths', lang): 'deaths'
+        cfr_label: 'cfr',
+        total_deaths_label: 'deaths'
     }
     
     metric_choice = st.sidebar.radio(
@@ -250,8 +404,11 @@ def main():
     # PREPARE SPATIAL DATA
     # ========================================================================
     
+    # Hashable, order-independent cache key for the region selection
+    region_key = tuple(sorted(selected_regions))
+    
     with st.spinner(f"{get_text('loading', lang)}..."):
-        district_data = prepare_spatial_data(df, selected_year, selected_regions)
+        district_data = prepare_spatial_data(selected_year, region_key)
     
     # ========================================================================
     # SUMMARY STATISTICS
@@ -265,12 +422,13 @@ def main():
     total_deaths = district_data['deaths'].sum()
     avg_incidence = district_data['incidence_rate'].mean()
     districts_affected = (district_data['cases'] > 0).sum()
+    total_districts = len(district_data)
     
     with col1:
-        st.metric(get_text('total_cases', lang), f"{total_cases:,.0f}")
+        st.metric(total_cases_label, f"{total_cases:,.0f}")
     
     with col2:
-        st.metric(get_text('total_deaths', lang), f"{total_deaths:,.0f}")
+        st.metric(total_deaths_label, f"{total_deaths:,.0f}")
     
     with col3:
         st.metric(
@@ -281,7 +439,7 @@ def main():
     with col4:
         st.metric(
             get_text('affected_districts', lang),
-            f"{districts_affected}/{len(district_data)}"
+            f"{districts_affected}/{total_districts}"
         )
     
     st.markdown("---")
@@ -307,38 +465,52 @@ def main():
     # Metric labels for hover/legend
     metric_label = metric_choice
     
-    if gdf is not None:
+    if geojson is not None:
         # ====================================================================
         # OPTION 1: Interactive choropleth with actual geometries
         # ====================================================================
         
-        # Merge district data with geometries
-        gdf_plot = gdf.merge(district_data, on='district_clean', how='left')
-        gdf_plot[metric_col] = gdf_plot[metric_col].fillna(0)
+        # Metric columns are precomputed; only the color column changes
+        map_data = build_map_frame(selected_year, region_key)
         
-        # Create choropleth map
+        # Create choropleth map (features matched on district_clean)
         fig_map = px.choropleth_mapbox(
-            gdf_plot,
-            geojson=gdf_plot.geometry,
-            locations=gdf_plot.index,
+            map_data,
+            geojson=geojson,
+            locations='district_clean',
+            featureidkey='properties.district_clean',
             color=metric_col,
             hover_name='district_clean',
-            hover_data={
-                'cases': ':,.0f',
-                'deaths': ':,.0f',
-                'incidence_rate': ':.2f',
-                'cfr': ':.2f',
-                'region': True
-            },
             color_continuous_scale=color_scale,
             mapbox_style='carto-positron',
             center={'lat': 6.5, 'lon': 12.5},  # Cameroon center
             zoom=5.5,
             opacity=0.7,
-            title=f'<b>{metric_choice} - {get_text("district", lang)} - {selected_year}</b>',
+            title=f'<b>{metric_choice} - {district_label} - {selected_year}</b>',
             labels={metric_col: metric_label}
         )
         
+        # Hover fields preformatted once server-side instead of per polygon in JS
+        hover_custom = np.stack([
+            np.array([f"{v:,.0f}" for v in map_data['cases']]),
+            np.array([f"{v:,.0f}" for v in map_data['deaths']]),
+            np.char.mod('%.2f', map_data['incidence_rate'].to_numpy()),
+            np.char.mod('%.2f', map_data['cfr'].to_numpy()),
+            map_data['region'].astype(str).to_numpy()
+        ], axis=-1)
+        
+        fig_map.update_traces(
+            customdata=hover_custom,
+            hovertemplate=(
+                '<b>%{hovertext}</b><br>'
+                f'{total_cases_label}: %{{customdata[0]}}<br>'
+                f'{total_deaths_label}: %{{customdata[1]}}<br>'
+                f'{get_text("incidence_rate", lang)}: %{{customdata[2]}}<br>'
+                f'{get_text("case_fatality_rate", lang)}: %{{customdata[3]}}%<br>'
+                f'{region_label}: %{{customdata[4]}}<extra></extra>'
+            )
+        )
+        
         fig_map.update_layout(
             height=700,
             margin=dict(l=0, r=0, t=50, b=0),
@@ -354,20 +526,32 @@ def main():
         
         st.warning(f"📊 {get_text('failed_load_geojson', lang)}")
         
-        # Create bar chart
-        fig_bar = px.bar(
-            district_data.head(30),  # Top 30 districts
-            x=metric_col,
-            y='district_clean',
+        # Create bar chart (plain go.Bar: no Plotly Express reshaping for 30 bars)
+        top = district_data.head(30)  # Top 30 districts
+        fig_bar = go.Figure(go.Bar(
+            x=top[metric_col],
+            y=top['district_clean'],
             orientation='h',
-            color=metric_col,
-            color_continuous_scale=color_scale,
-            title=f'<b>{get_text("top_districts", lang)} (30) - {metric_choice} - {selected_year}</b>',
-            labels={metric_col: metric_label, 'district_clean': get_text('district', lang)},
-            hover_data=['region', 'cases', 'deaths']
-        )
+            marker=dict(
+                color=top[metric_col],
+                colorscale=color_scale,
+                showscale=True,
+                colorbar=dict(title=metric_label)
+            ),
+            customdata=top[['region', 'cases', 'deaths']].to_numpy(),
+            hovertemplate=(
+                '<b>%{y}</b><br>'
+                f'{metric_label}: %{{x:,.2f}}<br>'
+                f'{region_label}: %{{customdata[0]}}<br>'
+                f'{total_cases_label}: %{{customdata[1]:,.0f}}<br>'
+                f'{total_deaths_label}: %{{customdata[2]:,.0f}}<extra></extra>'
+            )
+        ))
         
         fig_bar.update_layout(
+            title=f'<b>{get_text("top_districts", lang)} (30) - {metric_choice} - {selected_year}</b>',
+            xaxis_title=metric_label,
+            yaxis_title=district_label,
             height=800,
             showlegend=False,
             yaxis={'categoryorder': 'total ascending'}
@@ -381,7 +565,7 @@ def main():
     # DISTRICT RANKINGS TABLE
     # ========================================================================
     
-    st.subheader(f"📋 {get_text('district', lang)} {get_text('ranking', lang) if lang == 'en' else 'Classement'}")
+    st.subheader(f"📋 {district_label} {get_text('ranking', lang) if lang == 'en' else 'Classement'}")
     
     # Number of districts to show
     top_n = st.slider(
@@ -408,26 +592,29 @@ def main():
     display_df = display_df[display_columns].copy()
     display_df.columns = [
         get_text('rank', lang) if lang == 'en' else 'Rang',
-        get_text('region', lang),
-        get_text('district', lang),
-        get_text('total_cases', lang),
-        get_text('total_deaths', lang),
+        region_label,
+        district_label,
+        total_cases_label,
+        total_deaths_label,
         f"{get_text('incidence_rate', lang)} ({get_text('per_100k', lang)})",
-        f"{get_text('case_fatality_rate', lang)} (%)",
+        cfr_label,
         get_text('population', lang)
     ]
     
     # Display styled table
+    table_styles = gradient_styles(display_df, {
+        total_cases_label: 'YlOrRd',
+        cfr_label: 'RdYlGn_r',
+        f"{get_text('incidence_rate', lang)} ({get_text('per_100k', lang)})": 'YlOrRd'
+    })
     st.dataframe(
         display_df.style
-        .background_gradient(subset=[get_text('total_cases', lang)], cmap='YlOrRd')
-        .background_gradient(subset=[f"{get_text('case_fatality_rate', lang)} (%)"], cmap='RdYlGn_r')
-        .background_gradient(subset=[f"{get_text('incidence_rate', lang)} ({get_text('per_100k', lang)})"], cmap='YlOrRd')
+        .apply(lambda _: table_styles, axis=None)
         .format({
-            get_text('total_cases', lang): '{:,.0f}',
-            get_text('total_deaths', lang): '{:,.0f}',
+            total_cases_label: '{:,.0f}',
+            total_deaths_label: '{:,.0f}',
             f"{get_text('incidence_rate', lang)} ({get_text('per_100k', lang)})": '{:.2f}',
-            f"{get_text('case_fatality_rate', lang)} (%)": '{:.2f}',
+            cfr_label: '{:.2f}',
             get_text('population', lang): '{:,.0f}'
         }),
         use_container_width=True,
@@ -435,9 +622,11 @@ def main():
     )
     
     # Download button for table
-    csv_data = display_df.to_csv(index=False).encode('utf-8')
+    csv_buffer = io.BytesIO()
+    display_df.to_csv(csv_buffer, index=False, encoding='utf-8')
+    csv_data = csv_buffer.getvalue()
     st.download_button(
-        label=f"📥 {get_text('download', lang)} {get_text('district', lang)} {get_text('ranking', lang) if lang == 'en' else 'Classement'} (CSV)",
+        label=f"📥 {get_text('download', lang)} {district_label} {get_text('ranking', lang) if lang == 'en' else 'Classement'} (CSV)",
         data=csv_data,
         file_name=f"district_rankings_{selected_year}_{lang}.csv",
         mime="text/csv",
@@ -452,64 +641,81 @@ def main():
     
     st.subheader(f"🌍 {get_text('regional_distribution', lang)}")
     
-    # Aggregate by region
-    regional_summary = district_data.groupby('region').agg({
-        'cases': 'sum',
-        'deaths': 'sum',
-        'population': 'sum',
-        'district_clean': 'count'
-    }).reset_index()
-    
-    regional_summary.columns = [
-        get_text('region', lang),
-        get_text('cases', lang),
-        get_text('deaths', lang),
-        get_text('population', lang),
-        get_text('districts', lang) if lang == 'en' else 'Districts'
-    ]
-    
-    # Calculate rates
-    regional_summary[get_text('incidence_rate', lang)] = (
-        regional_summary[get_text('cases', lang)] / regional_summary[get_text('population', lang)] * 100000
-    )
-    regional_summary[f"{get_text('case_fatality_rate', lang)} (%)"] = (
-        regional_summary[get_text('deaths', lang)] / regional_summary[get_text('cases', lang)] * 100
-    ).fillna(0)
+    # Aggregate by region (canonical column names; translated only for display)
+    regional_summary = district_data.groupby('region', observed=True, sort=False).agg(
+        cases=('cases', 'sum'),
+        deaths=('deaths', 'sum'),
+        population=('population', 'sum'),
+        districts=('district_clean', 'count')
+    ).reset_index()
+    
+    # Calculate rates (CFR in one masked pass, 0 where a region has no cases)
+    arr_c = regional_summary['cases'].to_numpy(dtype=np.float64)
+    arr_d = regional_summary['deaths'].to_numpy(dtype=np.float64)
+    arr_p = regional_summary['population'].to_numpy(dtype=np.float64)
+    regional_summary['incidence_rate'] = (arr_c / arr_p * 100000).astype('float32')
+    regional_summary['cfr'] = np.where(
+        arr_c > 0, arr_d / np.where(arr_c > 0, arr_c, 1.0) * 100.0, 0.0
+    ).astype('float32')
     
     # Sort by cases
-    regional_summary = regional_summary.sort_values(get_text('cases', lang), ascending=False)
+    regional_summary = regional_summary.sort_values('cases', ascending=False)
+    
+    incidence_label = get_text('incidence_rate', lang)
+    districts_label = get_text('districts', lang) if lang == 'en' else 'Districts'
+    regional_display_names = {
+        'region': region_label,
+        'cases': cases_label,
+        'deaths': deaths_label,
+        'population': get_text('population', lang),
+        'districts': districts_label,
+        'incidence_rate': incidence_label,
+        'cfr': cfr_label
+    }
     
     # Display regional table
     st.dataframe(
-        regional_summary.style
-        .background_gradient(subset=[get_text('cases', lang)], cmap='YlOrRd')
-        .background_gradient(subset=[f"{get_text('case_fatality_rate', lang)} (%)"], cmap='RdYlGn_r')
+        regional_summary.rename(columns=regional_display_names).style
+        .background_gradient(subset=[cases_label], cmap='YlOrRd')
+        .background_gradient(subset=[cfr_label], cmap='RdYlGn_r')
         .format({
-            get_text('cases', lang): '{:,.0f}',
-            get_text('deaths', lang): '{:,.0f}',
+            cases_label: '{:,.0f}',
+            deaths_label: '{:,.0f}',
             get_text('population', lang): '{:,.0f}',
-            get_text('incidence_rate', lang): '{:.2f}',
-            f"{get_text('case_fatality_rate', lang)} (%)": '{:.2f}'
+            incidence_label: '{:.2f}',
+            cfr_label: '{:.2f}'
         }),
         use_container_width=True
     )
     
     # Regional bar chart
-    fig_regional = px.bar(
-        regional_summary,
-        x=get_text('cases', lang),
-        y=get_text('region', lang),
+    fig_regional = go.Figure(go.Bar(
+        x=regional_summary['cases'],
+        y=regional_summary['region'],
         orientation='h',
-        color=get_text('cases', lang),
-        color_continuous_scale='YlOrRd',
-        title=f'<b>{get_text("cases", lang)} - {get_text("region", lang)} - {selected_year}</b>',
-        text=get_text('cases', lang),
-        hover_data=[get_text('deaths', lang), get_text('districts', lang) if lang == 'en' else 'Districts', get_text('incidence_rate', lang), f"{get_text('case_fatality_rate', lang)} (%)"]
+        marker=dict(color=regional_summary['cases'], colorscale='YlOrRd', showscale=True),
+        text=regional_summary['cases'],
+        texttemplate='%{text:,}',
+        textposition='outside',
+        customdata=regional_summary[['deaths', 'districts', 'incidence_rate', 'cfr']].to_numpy(),
+        hovertemplate=(
+            '<b>%{y}</b><br>'
+            f'{cases_label}: %{{x:,.0f}}<br>'
+            f'{deaths_label}: %{{customdata[0]:,.0f}}<br>'
+            f'{districts_label}: %{{customdata[1]}}<br>'
+            f'{incidence_label}: %{{customdata[2]:.2f}}<br>'
+            f'{cfr_label}: %{{customdata[3]:.2f}}<extra></extra>'
+        )
+    ))
+    
+    fig_regional.update_layout(
+        title=f'<b>{cases_label} - {region_label} - {selected_year}</b>',
+        xaxis_title=cases_label,
+        yaxis_title=region_label,
+        height=400,
+        showlegend=False
     )
     
-    fig_regional.update_traces(texttemplate='%{text:,}', textposition='outside')
-    fig_regional.update_layout(height=400, showlegend=False)
-    
     st.plotly_chart(fig_regional, use_container_width=True)
     
     # ========================================================================
@@ -527,9 +733,9 @@ def main():
         st.info(f"""
         **🔴 {get_text('highest_burden', lang) if lang == 'en' else 'District le Plus Affecté'}:**
         
-        - **{get_text('district', lang)}:** {top_district['district_clean']}
-        - **{get_text('region', lang)}:** {top_district['region']}
-        - **{get_text('cases', lang)}:** {int(top_district['cases']):,}
+        - **{district_label}:** {top_district['district_clean']}
+        - **{region_label}:** {top_district['region']}
+        - **{cases_label}:** {int(top_district['cases']):,}
         - **{get_text('incidence_rate', lang)}:** {top_district['incidence_rate']:.2f} {get_text('per_100k', lang)}
         - **{get_text('case_fatality_rate', lang)}:** {top_district['cfr']:.2f}%
         """)
@@ -540,13 +746,13 @@ def main():
         if not high_cfr_districts.empty:
             high_cfr = high_cfr_districts.iloc[0]
             st.warning(f"""
-            **⚠️ {get_text('case_fatality_rate', lang)} {get_text('highest', lang) if lang == 'en' else 'le Plus Élevé'} ({get_text('districts', lang) if lang == 'en' else 'districts'} ≥10 {get_text('cases', lang)}):**
+            **⚠️ {get_text('case_fatality_rate', lang)} {get_text('highest', lang) if lang == 'en' else 'le Plus Élevé'} ({get_text('districts', lang) if lang == 'en' else 'districts'} ≥10 {cases_label}):**
             
-            - **{get_text('district', lang)}:** {high_cfr['district_clean']}
-            - **{get_text('region', lang)}:** {high_cfr['region']}
+            - **{district_label}:** {high_cfr['district_clean']}
+            - **{region_label}:** {high_cfr['region']}
             - **{get_text('case_fatality_rate', lang)}:** {high_cfr['cfr']:.2f}%
-            - **{get_text('cases', lang)}:** {int(high_cfr['cases']):,}
-            - **{get_text('deaths', lang)}:** {int(high_cfr['deaths']):,}
+            - **{cases_label}:** {int(high_cfr['cases']):,}
+            - **{deaths_label}:** {int(high_cfr['deaths']):,}
             
             *{get_text('action_investigate', lang)}*
             """)
@@ -557,7 +763,7 @@ def main():
     
     st.markdown("---")
     st.caption(f"**{get_text('year', lang)}:** {selected_year} | **{get_text('regions', lang)}:** {len(selected_regions)}")
-    st.caption(f"**{get_text('total', lang)} {get_text('districts', lang)}:** {len(district_data)} | **{get_text('districts', lang)} {get_text('cases', lang) if lang == 'en' else 'avec cas'}:** {(district_data['cases'] > 0).sum()}")
+    st.caption(f"**{get_text('total', lang)} {get_text('districts', lang)}:** {total_districts} | **{get_text('districts', lang)} {cases_label if lang == 'en' else 'avec cas'}:** {districts_affected}")
 
 
 # ============================================================================
@@ -20,9 +20,12 @@ BILINGUAL SUPPORT: Full English/French translation
 # IMPORTS
 # ============================================================================
 
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
+from matplotlib.figure import Figure
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -76,154 +79,252 @@ st.markdown("""
 # CACHED DATA LOADING
 # ============================================================================
 
+# Typed Parquet sibling written by prepare_parquet.py; CSV is the fallback
+PARQUET_PATH = 'cleaned_data/ml_final_100pct_geometry.parquet'
+CSV_PATH = 'cleaned_data/ml_final_100pct_geometry.csv'
+
+# Columns consumed by this page and their dtypes (applied at parse time)
+USED_COLS = ['data_year', 'week_number', 'region', 'cases']
+DTYPES = {
+    'data_year': 'int16',
+    'week_number': 'int8',
+    'region': 'category'
+}
+
+
 @st.cache_data(ttl=3600)
 def load_main_dataset():
-    """Load primary dataset"""
+    """Load primary dataset (Parquet, falling back to the CSV)"""
     try:
-        df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-        df['data_year'] = df['data_year'].astype('int16')
-        df['week_number'] = df['week_number'].astype('int8')
-        if 'region' in df.columns:
-            df['region'] = df['region'].astype('category')
-        if 'district_clean' in df.columns:
-            df['district_clean'] = df['district_clean'].astype('category')
+        if os.path.exists(PARQUET_PATH):
+            # Dtypes are stored in the Parquet schema; memory-map the file
+            table = pq.read_table(PARQUET_PATH, columns=USED_COLS, memory_map=True)
+            df = table.to_pandas()
+        else:
+            df = pd.read_csv(
+                CSV_PATH,
+                engine='pyarrow',
+                usecols=USED_COLS,
+                dtype=DTYPES
+            )
+        
+        # Weekly counts are whole numbers: smallest unsigned int that fits
+        df['cases'] = pd.to_numeric(df['cases'], downcast='unsigned')
         return df
     except Exception as e:
         st.error(f"{get_text('error_loading_data', lang)}: {str(e)}")
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=3600)
+def get_filter_options():
+    """Sidebar year and region choices (regions read from the category index)"""
+    df = load_main_dataset()
+    available_years = sorted(df['data_year'].unique().tolist(), reverse=True)
+    available_regions = df['region'].cat.categories.sort_values().tolist()
+    return available_years, available_regions
+
+
+@st.cache_resource(ttl=3600)
+def load_partitions():
+    """Split the dataset once into a {(year, region): sub-DataFrame} lookup"""
+    df = load_main_dataset()
+    return {
+        (int(year), region): group
+        for (year, region), group in df.groupby(['data_year', 'region'], observed=True, sort=False)
+    }
+
+
+def filter_years_regions(selected_years, selected_regions):
+    """Rows for the selected years and regions via (year, region) lookups"""
+    partitions = load_partitions()
+    frames = [
+        partitions[(year, region)]
+        for year in selected_years
+        for region in selected_regions
+        if (year, region) in partitions
+    ]
+    if not frames:
+        return load_main_dataset().iloc[0:0]
+    
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+@st.cache_data(ttl=3600)
+def build_year_week_region_cube():
+    """
+    Sum cases once into a dense [year, region, week] NumPy cube
+    
+    The yearly trends, epidemic weeks and heatmap all slice this one
+    array instead of each re-grouping the row-level data. A parallel
+    row-count cube records which (year, week) cells exist in the data.
+    
+    Returns:
+        Tuple (years, regions, cases_cube, rows_cube)
+    """
+    df = load_main_dataset()
+    years, year_idx = np.unique(df['data_year'].to_numpy(), return_inverse=True)
+    regions = np.asarray(df['region'].cat.categories, dtype=object)
+    region_idx = df['region'].cat.codes.to_numpy()
+    week_idx = df['week_number'].to_numpy().astype(np.intp)
+    
+    shape = (len(years), len(regions), 54)
+    # 64-bit accumulators: cases may be loaded as a narrow unsigned dtype
+    cases_cube = np.zeros(shape, dtype=np.float64)
+    rows_cube = np.zeros(shape, dtype=np.int64)
+    np.add.at(cases_cube, (year_idx, region_idx, week_idx), df['cases'].to_numpy(dtype=np.float64))
+    np.add.at(rows_cube, (year_idx, region_idx, week_idx), 1)
+    
+    return years, regions, cases_cube, rows_cube
+
+
+def year_week_slice(selected_years, selected_regions):
+    """Selected years, their (year x week) case sums and a data-presence mask"""
+    years, regions, cases_cube, rows_cube = build_year_week_region_cube()
+    year_mask = np.isin(years, selected_years)
+    region_mask = np.isin(regions, list(selected_regions))
+    
+    cases = cases_cube[year_mask][:, region_mask, :].sum(axis=1)
+    present = rows_cube[year_mask][:, region_mask, :].sum(axis=1) > 0
+    return years[year_mask], cases, present
+
+
+def weekly_totals(selected_years, selected_regions):
+    """Cases per (data_year, week_number) for the selected years and regions"""
+    years, cases, present = year_week_slice(selected_years, selected_regions)
+    year_pos, weeks = np.nonzero(present)
+    index = pd.MultiIndex.from_arrays(
+        [years[year_pos], weeks.astype(np.int8)],
+        names=['data_year', 'week_number']
+    )
+    return pd.Series(cases[year_pos, weeks], index=index, name='cases')
+
+
 @st.cache_data
-def get_seasonal_pattern(df, selected_years, selected_regions):
+def get_seasonal_pattern(selected_years: tuple, selected_regions: tuple):
     """
     Calculate weekly seasonal pattern
     Average cases by week number across all years
     """
-    df_filtered = df[
-        (df['data_year'].isin(selected_years)) &
-        (df['region'].isin(selected_regions))
-    ]
-    
-    weekly_pattern = df_filtered.groupby('week_number').agg({
-        'cases': ['mean', 'sum', 'std', 'min', 'max']
-    }).reset_index()
-    
-    weekly_pattern.columns = ['week_number', 'avg_cases', 'total_cases', 
-                               'std_cases', 'min_cases', 'max_cases']
+    df_filtered = filter_years_regions(selected_years, selected_regions)
+    
+    # Per-week aggregates with bincount (week_number is a small int)
+    w = df_filtered['week_number'].to_numpy().astype(np.intp)
+    c = df_filtered['cases'].to_numpy(dtype=np.float64)
+    
+    n = np.bincount(w, minlength=54)
+    s = np.bincount(w, weights=c, minlength=54)
+    s2 = np.bincount(w, weights=c * c, minlength=54)
+    
+    mn = np.full(n.shape, np.inf)
+    mx = np.full(n.shape, -np.inf)
+    np.minimum.at(mn, w, c)
+    np.maximum.at(mx, w, c)
+    
+    # Only weeks present in the data, as groupby would return
+    weeks = np.flatnonzero(n)
+    n, s, s2 = n[weeks], s[weeks], s2[weeks]
+    avg = s / n
+    
+    # Sample standard deviation (ddof=1, NaN for single-row weeks)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var = np.where(n > 1, (s2 - s * avg) / (n - 1), np.nan)
+    std = np.sqrt(np.clip(var, 0, None))
+    
+    weekly_pattern = pd.DataFrame({
+        'week_number': weeks.astype(df_filtered['week_number'].dtype),
+        'avg_cases': avg,
+        'total_cases': s,
+        'std_cases': std,
+        'min_cases': mn[weeks],
+        'max_cases': mx[weeks]
+    })
     
     return weekly_pattern
 
 
 @st.cache_data
-def get_yearly_trends(df, selected_years, selected_regions):
+def get_yearly_trends(selected_years: tuple, selected_regions: tuple):
     """Get year-by-year weekly trends for comparison"""
-    df_filtered = df[
-        (df['data_year'].isin(selected_years)) &
-        (df['region'].isin(selected_regions))
-    ]
-    
-    yearly_weekly = df_filtered.groupby(['data_year', 'week_number'])['cases'].sum().reset_index()
+    yearly_weekly = weekly_totals(selected_years, selected_regions).reset_index()
     
     return yearly_weekly
 
 
+@st.cache_data
+def get_year_week_matrix(selected_years: tuple, selected_regions: tuple):
+    """Year x week cases matrix for the epidemic heatmap (0 where no data)"""
+    years, cases, present = year_week_slice(selected_years, selected_regions)
+    year_rows = present.any(axis=1)
+    week_cols = np.flatnonzero(present.any(axis=0))
+    
+    return pd.DataFrame(
+        cases[year_rows][:, week_cols],
+        index=pd.Index(years[year_rows], name='data_year'),
+        columns=pd.Index(week_cols.astype(np.int8), name='week_number')
+    )
+
+
 @st.cache_data  
-def identify_epidemic_weeks(df, selected_years, selected_regions, threshold_percentile=90):
+def identify_epidemic_weeks(selected_years: tuple, selected_regions: tuple, threshold_percentile=90):
     """Identify high-transmission weeks (epidemic weeks)"""
-    df_filtered = df[
-        (df['data_year'].isin(selected_years)) &
-        (df['region'].isin(selected_regions))
-    ]
+    # Dense (year x week) totals from the cube; threshold and mask in NumPy
+    years, cases, present = year_week_slice(selected_years, selected_regions)
+    observed_cases = cases[present]
     
     # Calculate threshold (90th percentile by default)
-    threshold = df_filtered.groupby(['data_year', 'week_number'])['cases'].sum().quantile(threshold_percentile / 100)
+    threshold = np.quantile(observed_cases, threshold_percentile / 100) if observed_cases.size else np.nan
     
     # Identify weeks above threshold
-    weekly_cases = df_filtered.groupby(['data_year', 'week_number'])['cases'].sum().reset_index()
-    epidemic_weeks = weekly_cases[weekly_cases['cases'] > threshold].copy()
+    year_pos, weeks = np.nonzero(present & (cases > threshold))
+    epidemic_weeks = pd.DataFrame({
+        'data_year': years[year_pos],
+        'week_number': weeks.astype(np.int8),
+        'cases': cases[year_pos, weeks]
+    })
     
     return epidemic_weeks, threshold
 
 
 # ============================================================================
-# MAIN PAGE FUNCTION
+# CHART RENDERING
 # ============================================================================
 
-def main():
-    """Main function for Temporal Analysis page"""
-    
-    # Get language
-    lang = st.session_state.get('language', 'en')
-    
-    # ========================================================================
-    # HEADER
-    # ========================================================================
-    
-    st.markdown(f'''
-    <div class="dashboard-header">
-        <h1>📈 {get_text('temporal_analysis', lang)} - {get_text('seasonal_pattern', lang)} & {get_text('temporal_trends', lang)}</h1>
-    </div>
-    ''', unsafe_allow_html=True)
-    
-    # ========================================================================
-    # LOAD DATA
-    # ========================================================================
-    
-    with st.spinner(f"{get_text('loading_data', lang)}"):
-        df = load_main_dataset()
-    
-    if df.empty:
-        st.error(f"❌ {get_text('failed_load_data', lang)}")
-        st.stop()
-    
-    # ========================================================================
-    # SIDEBAR FILTERS
-    # ========================================================================
-    
-    st.sidebar.header(f"🔍 {get_text('filters', lang)}")
-    st.sidebar.markdown("---")
-    
-    # Year filter (multiple years for comparison)
-    available_years = sorted(df['data_year'].unique(), reverse=True)
-    selected_years = st.sidebar.multiselect(
-        get_text('select', lang) + ' ' + get_text('years', lang),
-        options=available_years,
-        default=available_years[:3],  # Default: most recent 3 years
-        help=get_text('choose_multiple_years', lang)
-    )
-    
-    # Region filter
-    available_regions = sorted(df['region'].unique())
-    selected_regions = st.sidebar.multiselect(
-        get_text('select', lang) + ' ' + get_text('regions', lang),
-        options=available_regions,
-        default=available_regions,
-        help=get_text('choose_multiple_years', lang) if lang == 'en' else 'Choisir les régions à inclure'
-    )
-    
-    if not selected_years or not selected_regions:
-        st.warning(f"⚠️ {get_text('please_select', lang)}")
-        st.stop()
-    
-    st.sidebar.markdown("---")
-    st.sidebar.info(f"""
-    **{get_text('current_configuration', lang)}:**
-    - {get_text('years', lang)}: {len(selected_years)}
-    - {get_text('regions', lang)}: {len(selected_regions)}
-    """)
-    
-    # ========================================================================
-    # SEASONAL PATTERN ANALYSIS
-    # ========================================================================
-    
-    st.subheader(f"🌊 {get_text('seasonal_pattern', lang)} - {get_text('weekly_average', lang)} {get_text('cases', lang)}")
-    
-    # Get seasonal pattern
-    weekly_pattern = get_seasonal_pattern(df, selected_years, selected_regions)
-    
-    # Identify high-risk weeks (top 25%)
-    high_risk_threshold = weekly_pattern['avg_cases'].quantile(0.75)
+@st.cache_data
+def render_heatmap_png(heatmap_data, title, x_label, y_label, color_label):
+    """
+    Rasterize the year x week heatmap to PNG bytes
     
+    A single image instead of one Plotly cell per (year, week), so the
+    browser cost no longer grows with the number of selected years.
+    """
+    fig = Figure(figsize=(12, 1.6 + 0.35 * len(heatmap_data)), dpi=120)
+    ax = fig.add_subplot()
+    
+    image = ax.imshow(heatmap_data.to_numpy(), cmap='YlOrRd', aspect='auto', interpolation='nearest')
+    
+    weeks = heatmap_data.columns.to_numpy()
+    week_ticks = np.flatnonzero(weeks % 4 == 1)
+    ax.set_xticks(week_ticks, labels=weeks[week_ticks])
+    ax.set_yticks(np.arange(len(heatmap_data)), labels=heatmap_data.index)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_title(title, fontweight='bold')
+    fig.colorbar(image, ax=ax, label=color_label, pad=0.01)
+    fig.tight_layout()
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+# ============================================================================
+# PAGE SECTIONS (fragments: rerun on their own, not with the whole page)
+# ============================================================================
+
+@st.fragment
+def render_seasonal_section(weekly_pattern, high_risk_threshold, high_risk_weeks, lang):
+    """Seasonal pattern chart with the high-risk week callout"""
     # Create seasonal pattern chart
     fig_seasonal = go.Figure()
     
@@ -283,11 +384,9 @@ def main():
         showlegend=True
     )
     
-    st.plotly_chart(fig_seasonal, use_container_width=True)
-    
-    # Identify and display high-risk weeks
-    high_risk_weeks = weekly_pattern[weekly_pattern['avg_cases'] > high_risk_threshold]['week_number'].tolist()
+    st.plotly_chart(fig_seasonal, use_container_width=True, key='seasonal_pattern', config={'displayModeBar': False})
     
+    # Display high-risk weeks
     if high_risk_weeks:
         weeks_text = ', '.join(map(str, high_risk_weeks))
         recommendation_text = get_text('action_enhanced_surveillance', lang) if lang == 'en' else 'Intensifier la surveillance et préparer les ressources pendant ces semaines'
@@ -299,118 +398,99 @@ def main():
             <em>{recommendation_text}</em>
         </div>
         """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # ========================================================================
-    # YEAR-OVER-YEAR COMPARISON
-    # ========================================================================
-    
-    st.subheader(f"📊 {get_text('comparison', lang)} {get_text('year', lang) if lang == 'en' else 'Année après Année'}")
-    
-    # Get yearly trends
-    yearly_weekly = get_yearly_trends(df, selected_years, selected_regions)
-    
-    # Create year-over-year comparison chart
-    fig_yoy = px.line(
-        yearly_weekly,
-        x='week_number',
-        y='cases',
-        color='data_year',
-        title=f"<b>{get_text('weekly_average', lang)} {get_text('cases', lang)} - {get_text('year', lang)}</b>",
-        labels={
-            'week_number': get_text('week_number', lang),
-            'cases': get_text('total_cases', lang),
-            'data_year': get_text('year', lang)
-        },
-        markers=True,
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
+
+
+@st.fragment
+def render_yoy_section(yearly_weekly, lang):
+    """Year-over-year weekly cases chart"""
+    # Create year-over-year comparison chart (one WebGL trace per year);
+    # rows are already ordered by year, so split the arrays at year starts
+    years = yearly_weekly['data_year'].to_numpy()
+    unique_years, year_starts = np.unique(years, return_index=True)
+    week_arrays = np.split(yearly_weekly['week_number'].to_numpy(), year_starts[1:])
+    case_arrays = np.split(yearly_weekly['cases'].to_numpy(), year_starts[1:])
+    
+    yoy_colors = px.colors.qualitative.Set2
+    fig_yoy = go.Figure([
+        go.Scattergl(
+            x=weeks,
+            y=cases,
+            mode='lines+markers',
+            name=str(year),
+            line=dict(color=yoy_colors[i % len(yoy_colors)]),
+            hovertemplate=f'{year}: %{{y:,.0f}}<extra></extra>'
+        )
+        for i, (year, weeks, cases) in enumerate(zip(unique_years, week_arrays, case_arrays))
+    ])
     
     fig_yoy.update_layout(
+        title=f"<b>{get_text('weekly_average', lang)} {get_text('cases', lang)} - {get_text('year', lang)}</b>",
+        xaxis_title=get_text('week_number', lang),
+        yaxis_title=get_text('total_cases', lang),
         height=500,
-        hovermode='x unified',
+        hovermode='x',
         legend=dict(title=get_text('year', lang), orientation="h", y=1.1)
     )
     
-    st.plotly_chart(fig_yoy, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # ========================================================================
-    # EPIDEMIC TIMELINE
-    # ========================================================================
-    
-    st.subheader(f"🔴 {get_text('outbreak_pattern', lang) if lang == 'en' else 'Chronologie des Semaines Épidémiques'}")
-    
-    # Identify epidemic weeks
-    epidemic_weeks, threshold = identify_epidemic_weeks(df, selected_years, selected_regions)
-    
+    st.plotly_chart(fig_yoy, use_container_width=True, key='yoy_comparison', config={'displayModeBar': False})
+
+
+@st.fragment
+def render_epidemic_section(epidemic_weeks, threshold, year_key, region_key, lang):
+    """Epidemic threshold, heatmap and top epidemic weeks table"""
     st.info(f"**{get_text('threshold', lang) if lang == 'en' else 'Seuil Épidémique'}:** {threshold:.0f} {get_text('cases', lang)}/{get_text('week', lang)} (90e percentile)")
     
     # Create epidemic timeline heatmap
     if not epidemic_weeks.empty:
-        # Pivot for heatmap
-        heatmap_data = yearly_weekly.pivot(
-            index='data_year',
-            columns='week_number',
-            values='cases'
-        ).fillna(0)
+        # Year x week matrix sliced from the cached cube
+        heatmap_data = get_year_week_matrix(year_key, region_key)
         
-        # Create heatmap
-        fig_heatmap = px.imshow(
+        # Render heatmap as a pre-rasterized image
+        heatmap_png = render_heatmap_png(
             heatmap_data,
-            labels=dict(
-                x=get_text('week_number', lang),
-                y=get_text('year', lang),
-                color=get_text('cases', lang)
-            ),
-            x=heatmap_data.columns,
-            y=heatmap_data.index,
-            color_continuous_scale='YlOrRd',
-            title=f"<b>{get_text('heatmap', lang)} - {get_text('cases', lang)} ({get_text('years', lang)})</b>",
-            aspect='auto'
-        )
-        
-        fig_heatmap.update_layout(
-            height=400,
-            xaxis_title=get_text('week_number', lang),
-            yaxis_title=get_text('year', lang)
+            f"{get_text('heatmap', lang)} - {get_text('cases', lang)} ({get_text('years', lang)})",
+            get_text('week_number', lang),
+            get_text('year', lang),
+            get_text('cases', lang)
         )
         
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.image(heatmap_png, use_container_width=True)
         
         # Display epidemic weeks table (limit to top 20 for size)
         st.subheader(f"📋 {get_text('top_districts', lang).replace('Districts', '20 ' + (get_text('week', lang) if lang == 'en' else 'Semaines Épidémiques'))}")
         
-        epidemic_weeks_display = epidemic_weeks.nlargest(20, 'cases').copy()
+        # Top 20 by cases with an O(n) partition, then a 20-row sort
+        top_n = 20
+        if len(epidemic_weeks) > top_n:
+            top_idx = np.argpartition(-epidemic_weeks['cases'].to_numpy(), top_n - 1)[:top_n]
+            epidemic_weeks_display = epidemic_weeks.iloc[top_idx]
+        else:
+            epidemic_weeks_display = epidemic_weeks
         epidemic_weeks_display = epidemic_weeks_display.sort_values(['data_year', 'week_number'])
         
-        st.dataframe(
-            epidemic_weeks_display,
-            use_container_width=True,
-            column_config={
-                'data_year': st.column_config.NumberColumn(get_text('year', lang), format='%d'),
-                'week_number': st.column_config.NumberColumn(get_text('week', lang), format='%d'),
-                'cases': st.column_config.NumberColumn(get_text('cases', lang), format='%d')
-            },
-            hide_index=True
+        # 20 rows: a static HTML table instead of the interactive grid component
+        epidemic_table = epidemic_weeks_display.rename(columns={
+            'data_year': get_text('year', lang),
+            'week_number': get_text('week', lang),
+            'cases': get_text('cases', lang)
+        })
+        st.markdown(
+            epidemic_table.style
+            .format({get_text('cases', lang): '{:,.0f}'})
+            .hide(axis='index')
+            .to_html(),
+            unsafe_allow_html=True
         )
     else:
         st.info(f"{get_text('no_data_available', lang)}")
-    
-    st.markdown("---")
-    
-    # ========================================================================
-    # TEMPORAL STATISTICS
-    # ========================================================================
-    
-    st.subheader(f"📊 {get_text('summary_statistics', lang)} {get_text('temporal_analysis', lang)}")
-    
+
+
+@st.fragment
+def render_stats_section(peak_week, lowest_week, high_risk_weeks, epidemic_weeks, lang):
+    """Summary metric cards for the temporal analysis"""
     stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
     
     with stat_col1:
-        peak_week = weekly_pattern.loc[weekly_pattern['avg_cases'].idxmax(), 'week_number']
         st.metric(
             f"{get_text('peak', lang) if lang == 'en' else 'Semaine de Pointe'} {get_text('week', lang)}",
             f"{get_text('week', lang)} {int(peak_week)}",
@@ -418,7 +498,6 @@ def main():
         )
     
     with stat_col2:
-        lowest_week = weekly_pattern.loc[weekly_pattern['avg_cases'].idxmin(), 'week_number']
         st.metric(
             f"{get_text('lowest', lang) if lang == 'en' else 'Semaine la Plus Basse'}",
             f"{get_text('week', lang)} {int(lowest_week)}",
@@ -438,49 +517,180 @@ def main():
             len(epidemic_weeks),
             help=get_text('outbreak_detection', lang) if lang == 'en' else 'Nombre de semaines dépassant le seuil épidémique'
         )
+
+
+# ============================================================================
+# MAIN PAGE FUNCTION
+# ============================================================================
+
+def main():
+    """Main function for Temporal Analysis page"""
+    
+    # Get language
+    lang = st.session_state.get('language', 'en')
     
     # ========================================================================
-    # INSIGHTS
+    # HEADER
+    # ========================================================================
+    
+    st.markdown(f'''
+    <div class="dashboard-header">
+        <h1>📈 {get_text('temporal_analysis', lang)} - {get_text('seasonal_pattern', lang)} & {get_text('temporal_trends', lang)}</h1>
+    </div>
+    ''', unsafe_allow_html=True)
+    
+    # ========================================================================
+    # LOAD DATA
+    # ========================================================================
+    
+    with st.spinner(f"{get_text('loading_data', lang)}"):
+        df = load_main_dataset()
+    
+    if df.empty:
+        st.error(f"❌ {get_text('failed_load_data', lang)}")
+        st.stop()
+    
+    # ========================================================================
+    # SIDEBAR FILTERS
+    # ========================================================================
+    
+    st.sidebar.header(f"🔍 {get_text('filters', lang)}")
+    st.sidebar.markdown("---")
+    
+    # Year filter (multiple years for comparison)
+    available_years, available_regions = get_filter_options()
+    selected_years = st.sidebar.multiselect(
+        get_text('select', lang) + ' ' + get_text('years', lang),
+        options=available_years,
+        default=available_years[:3],  # Default: most recent 3 years
+        help=get_text('choose_multiple_years', lang)
+    )
+    
+    # Region filter
+    selected_regions = st.sidebar.multiselect(
+        get_text('select', lang) + ' ' + get_text('regions', lang),
+        options=available_regions,
+        default=available_regions,
+        help=get_text('choose_multiple_years', lang) if lang == 'en' else 'Choisir les régions à inclure'
+    )
+    
+    if not selected_years or not selected_regions:
+        st.warning(f"⚠️ {get_text('please_select', lang)}")
+        st.stop()
+    
+    # Hashable, order-independent cache keys for the cached helpers
+    year_key = tuple(sorted(int(y) for y in selected_years))
+    region_key = tuple(sorted(selected_regions))
+    
+    # Reuse the previous run's results while the filters are unchanged, so
+    # reruns from unrelated widgets skip even the cache-key hashing
+    analysis_key = (year_key, region_key)
+    if st.session_state.get('temporal_analysis_key') == analysis_key:
+        weekly_pattern, yearly_weekly, epidemic_weeks, threshold = st.session_state['temporal_analysis_results']
+    else:
+        weekly_pattern = get_seasonal_pattern(year_key, region_key)
+        yearly_weekly = get_yearly_trends(year_key, region_key)
+        epidemic_weeks, threshold = identify_epidemic_weeks(year_key, region_key)
+        st.session_state['temporal_analysis_key'] = analysis_key
+        st.session_state['temporal_analysis_results'] = (weekly_pattern, yearly_weekly, epidemic_weeks, threshold)
+    
+    st.sidebar.markdown("---")
+    st.sidebar.info(f"""
+    **{get_text('current_configuration', lang)}:**
+    - {get_text('years', lang)}: {len(selected_years)}
+    - {get_text('regions', lang)}: {len(selected_regions)}
+    """)
+    
+    # ========================================================================
+    # SEASONAL PATTERN ANALYSIS
+    # ========================================================================
+    
+    st.subheader(f"🌊 {get_text('seasonal_pattern', lang)} - {get_text('weekly_average', lang)} {get_text('cases', lang)}")
+    
+    # Threshold (top 25%), high-risk weeks and peak/lowest weeks in one place
+    avg_cases = weekly_pattern['avg_cases'].to_numpy()
+    week_numbers = weekly_pattern['week_number'].to_numpy()
+    high_risk_threshold = np.quantile(avg_cases, 0.75)
+    high_risk_weeks = week_numbers[avg_cases > high_risk_threshold].tolist()
+    peak_week = week_numbers[avg_cases.argmax()]
+    lowest_week = week_numbers[avg_cases.argmin()]
+    
+    render_seasonal_section(weekly_pattern, high_risk_threshold, high_risk_weeks, lang)
+    
+    st.markdown("---")
+    
     # ========================================================================
+    # YEAR-OVER-YEAR COMPARISON
+    # ========================================================================
+    
+    st.subheader(f"📊 {get_text('comparison', lang)} {get_text('year', lang) if lang == 'en' else 'Année après Année'}")
+    
+    render_yoy_section(yearly_weekly, lang)
     
     st.markdown("---")
-    st.subheader(f"💡 {get_text('insights', lang)} {get_text('temporal_analysis', lang)}")
     
-    insight_col1, insight_col2 = st.columns(2)
+    # ========================================================================
+    # EPIDEMIC TIMELINE
+    # ========================================================================
+    
+    # Collapsed by default: first paint is the seasonal and year-over-year charts
+    with st.expander(f"🔴 {get_text('outbreak_pattern', lang) if lang == 'en' else 'Chronologie des Semaines Épidémiques'}", expanded=False):
+        render_epidemic_section(epidemic_weeks, threshold, year_key, region_key, lang)
     
-    with insight_col1:
-        seasonality_text = get_text('seasonal_pattern', lang) if lang == 'en' else 'Forte saisonnalité détectée' if len(high_risk_weeks) > 5 else 'Saisonnalité modérée'
-        
-        st.info(f"""
-        **🌊 {get_text('seasonal_pattern', lang)}:**
+    st.markdown("---")
+    
+    # ========================================================================
+    # TEMPORAL STATISTICS
+    # ========================================================================
+    
+    st.subheader(f"📊 {get_text('summary_statistics', lang)} {get_text('temporal_analysis', lang)}")
+    
+    render_stats_section(peak_week, lowest_week, high_risk_weeks, epidemic_weeks, lang)
+    
+    # ========================================================================
+    # INSIGHTS
+    # ========================================================================
+    
+    st.markdown("---")
+    with st.expander(f"💡 {get_text('insights', lang)} {get_text('temporal_analysis', lang)}", expanded=False):
+        insight_col1, insight_col2 = st.columns(2)
         
-        - **{get_text('peak', lang) if lang == 'en' else 'Transmission pic'}:** {get_text('week', lang)} {int(peak_week)}
-        - **{get_text('lowest', lang) if lang == 'en' else 'Transmission la plus basse'}:** {get_text('week', lang)} {int(lowest_week)}
-        - **{get_text('high_risk', lang)} {get_text('week', lang) if lang == 'en' else 'saison'}:** {len(high_risk_weeks)} {get_text('week', lang) if lang == 'en' else 'semaines identifiées'}
-        - **{get_text('outbreak_pattern', lang) if lang == 'en' else 'Schéma'}:** {seasonality_text}
-        """)
-    
-    with insight_col2:
-        # Compare years
-        if len(selected_years) > 1:
-            recent_year = max(selected_years)
-            prev_year = sorted(selected_years)[-2] if len(selected_years) > 1 else recent_year - 1
+        with insight_col1:
+            seasonality_text = get_text('seasonal_pattern', lang) if lang == 'en' else 'Forte saisonnalité détectée' if len(high_risk_weeks) > 5 else 'Saisonnalité modérée'
             
-            recent_total = yearly_weekly[yearly_weekly['data_year'] == recent_year]['cases'].sum()
-            prev_total = yearly_weekly[yearly_weekly['data_year'] == prev_year]['cases'].sum()
+            st.info(f"""
+            **🌊 {get_text('seasonal_pattern', lang)}:**
             
-            change = ((recent_total - prev_total) / prev_total * 100) if prev_total > 0 else 0
-            
-            status_text = f"⚠️ {get_text('increasing', lang) if lang == 'en' else 'Tendance croissante'}" if change > 10 else f"✅ {get_text('stable', lang) if lang == 'en' else 'Stable ou décroissant'}"
-            
-            st.warning(f"""
-            **📈 {get_text('temporal_trends', lang) if lang == 'en' else 'Tendance Récente'}:**
-            
-            - **{recent_year}:** {int(recent_total):,} {get_text('total_cases', lang)}
-            - **{prev_year}:** {int(prev_total):,} {get_text('total_cases', lang)}
-            - **{get_text('change', lang) if lang == 'en' else 'Changement'}:** {change:+.1f}%
-            - **{get_text('status', lang) if lang == 'en' else 'Statut'}:** {status_text}
+            - **{get_text('peak', lang) if lang == 'en' else 'Transmission pic'}:** {get_text('week', lang)} {int(peak_week)}
+            - **{get_text('lowest', lang) if lang == 'en' else 'Transmission la plus basse'}:** {get_text('week', lang)} {int(lowest_week)}
+            - **{get_text('high_risk', lang)} {get_text('week', lang) if lang == 'en' else 'saison'}:** {len(high_risk_weeks)} {get_text('week', lang) if lang == 'en' else 'semaines identifiées'}
+            - **{get_text('outbreak_pattern', lang) if lang == 'en' else 'Schéma'}:** {seasonality_text}
             """)
+        
+        with insight_col2:
+            # Compare years
+            if len(selected_years) > 1:
+                # year_key is already sorted ascending
+                recent_year = year_key[-1]
+                prev_year = year_key[-2] if len(year_key) > 1 else recent_year - 1
+                
+                # Annual totals from one grouped pass over the weekly totals
+                totals_by_year = yearly_weekly.groupby('data_year', observed=True)['cases'].sum()
+                recent_total = totals_by_year.get(recent_year, 0)
+                prev_total = totals_by_year.get(prev_year, 0)
+                
+                change = ((recent_total - prev_total) / prev_total * 100) if prev_total > 0 else 0
+                
+                status_text = f"⚠️ {get_text('increasing', lang) if lang == 'en' else 'Tendance croissante'}" if change > 10 else f"✅ {get_text('stable', lang) if lang == 'en' else 'Stable ou décroissant'}"
+                
+                st.warning(f"""
+                **📈 {get_text('temporal_trends', lang) if lang == 'en' else 'Tendance Récente'}:**
+                
+                - **{recent_year}:** {int(recent_total):,} {get_text('total_cases', lang)}
+                - **{prev_year}:** {int(prev_total):,} {get_text('total_cases', lang)}
+                - **{get_text('change', lang) if lang == 'en' else 'Changement'}:** {change:+.1f}%
+                - **{get_text('status', lang) if lang == 'en' else 'Statut'}:** {status_text}
+                """)
     
     # ========================================================================
     # FOOTER
@@ -82,18 +82,28 @@ def load_main_dataset():
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=3600)
+def get_filter_options():
+    """Sidebar year and region choices (regions read from the category index)"""
+    df = load_main_dataset()
+    available_years = sorted(df['data_year'].unique().tolist(), reverse=True)
+    available_regions = df['region'].cat.categories.sort_values().tolist()
+    return available_years, available_regions
+
+
 @st.cache_data
-def get_seasonal_pattern(df, selected_years, selected_regions):
+def get_seasonal_pattern(selected_years: tuple, selected_regions: tuple):
     """
     Calculate weekly seasonal pattern
     Average cases by week number across all years
     """
+    df = load_main_dataset()
     df_filtered = df[
         (df['data_year'].isin(selected_years)) &
         (df['region'].isin(selected_regions))
     ]
     
-    weekly_pattern = df_filtered.groupby('week_number').agg({
+    weekly_pattern = df_filtered.groupby('week_number', observed=True).agg({
         'cases': ['mean', 'sum', 'std', 'min', 'max']
     }).reset_index()
     
@@ -104,31 +114,33 @@ def get_seasonal_pattern(df, selected_years, selected_regions):
 
 
 @st.cache_data
-def get_yearly_trends(df, selected_years, selected_regions):
+def get_yearly_trends(selected_years: tuple, selected_regions: tuple):
     """Get year-by-year weekly trends for comparison"""
+    df = load_main_dataset()
     df_filtered = df[
         (df['data_year'].isin(selected_years)) &
         (df['region'].isin(selected_regions))
     ]
     
-    yearly_weekly = df_filtered.groupby(['data_year', 'week_number'])['cases'].sum().reset_index()
+    yearly_weekly = df_filtered.groupby(['data_year', 'week_number'], observed=True)['cases'].sum().reset_index()
     
     return yearly_weekly
 
 
 @st.cache_data  
-def identify_epidemic_weeks(df, selected_years, selected_regions, threshold_percentile=90):
+def identify_epidemic_weeks(selected_years: tuple, selected_regions: tuple, threshold_percentile=90):
     """Identify high-transmission weeks (epidemic weeks)"""
+    df = load_main_dataset()
     df_filtered = df[
         (df['data_year'].isin(selected_years)) &
         (df['region'].isin(selected_regions))
     ]
     
     # Calculate threshold (90th percentile by default)
-    threshold = df_filtered.groupby(['data_year', 'week_number'])['cases'].sum().quantile(threshold_percentile / 100)
+    threshold = df_filtered.groupby(['data_year', 'week_number'], observed=True, sort=False)['cases'].sum().quantile(threshold_percentile / 100)
     
     # Identify weeks above threshold
-    weekly_cases = df_filtered.groupby(['data_year', 'week_number'])['cases'].sum().reset_index()
+    weekly_cases = df_filtered.groupby(['data_year', 'week_number'], observed=True, sort=False)['cases'].sum().reset_index()
     epidemic_weeks = weekly_cases[weekly_cases['cases'] > threshold].copy()
     
     return epidemic_weeks, threshold
@@ -170,7 +182,7 @@ def main():
     st.sidebar.markdown("---")
     
     # Year filter (multiple years for comparison)
-    available_years = sorted(df['data_year'].unique(), reverse=True)
+    available_years, available_regions = get_filter_options()
     selected_years = st.sidebar.multiselect(
         "Select Years",
         options=available_years,
@@ -179,7 +191,6 @@ def main():
     )
     
     # Region filter
-    available_regions = sorted(df['region'].unique())
     selected_regions = st.sidebar.multiselect(
         "Select Regions",
         options=available_regions,
@@ -191,6 +202,10 @@ def main():
         st.warning("⚠️ Please select at least one year and one region.")
         st.stop()
     
+    # Hashable, order-independent cache keys; the dataset itself is not hashed
+    year_key = tuple(sorted(int(y) for y in selected_years))
+    region_key = tuple(sorted(selected_regions))
+    
     st.sidebar.markdown("---")
     st.sidebar.info(f"""
     **Current Selection:**
@@ -205,7 +220,7 @@ def main():
     st.subheader("🌊 Seasonal Pattern - Weekly Average Cases")
     
     # Get seasonal pattern
-    weekly_pattern = get_seasonal_pattern(df, selected_years, selected_regions)
+    weekly_pattern = get_seasonal_pattern(year_key, region_key)
     
     # Identify high-risk weeks (top 25%)
     high_risk_threshold = weekly_pattern['avg_cases'].quantile(0.75)
@@ -270,7 +285,7 @@ def main():
         showlegend=True
     )
     
-    st.plotly_chart(fig_seasonal, use_container_width=True)
+    st.plotly_chart(fig_seasonal, use_container_width=True, key='seasonal_pattern', config={'displayModeBar': False})
     
     # Identify and display high-risk weeks
     high_risk_weeks = weekly_pattern[weekly_pattern['avg_cases'] > high_risk_threshold]['week_number'].tolist()
@@ -293,27 +308,37 @@ def main():
     st.subheader("📊 Year-over-Year Comparison")
     
     # Get yearly trends
-    yearly_weekly = get_yearly_trends(df, selected_years, selected_regions)
-    
-    # Create year-over-year comparison chart
-    fig_yoy = px.line(
-        yearly_weekly,
-        x='week_number',
-        y='cases',
-        color='data_year',
-        title="<b>Weekly Cases by Year</b>",
-        labels={'week_number': 'Week Number', 'cases': 'Total Cases', 'data_year': 'Year'},
-        markers=True,
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
+    yearly_weekly = get_yearly_trends(year_key, region_key)
+    
+    # Create year-over-year comparison chart (one WebGL trace per year);
+    # rows are already ordered by year, so split the arrays at year starts
+    unique_years, year_starts = np.unique(yearly_weekly['data_year'].to_numpy(), return_index=True)
+    week_arrays = np.split(yearly_weekly['week_number'].to_numpy(), year_starts[1:])
+    case_arrays = np.split(yearly_weekly['cases'].to_numpy(), year_starts[1:])
+    
+    yoy_colors = px.colors.qualitative.Set2
+    fig_yoy = go.Figure([
+        go.Scattergl(
+            x=weeks,
+            y=cases,
+            mode='lines+markers',
+            name=str(year),
+            line=dict(color=yoy_colors[i % len(yoy_colors)]),
+            hovertemplate=f'Year={year}<br>Week Number=%{{x}}<br>Total Cases=%{{y}}<extra></extra>'
+        )
+        for i, (year, weeks, cases) in enumerate(zip(unique_years, week_arrays, case_arrays))
+    ])
     
     fig_yoy.update_layout(
+        title="<b>Weekly Cases by Year</b>",
+        xaxis_title="Week Number",
+        yaxis_title="Total Cases",
         height=500,
         hovermode='x unified',
         legend=dict(title="Year", orientation="h", y=1.1)
     )
     
-    st.plotly_chart(fig_yoy, use_container_width=True)
+    st.plotly_chart(fig_yoy, use_container_width=True, key='yoy_comparison', config={'displayModeBar': False})
     
     st.markdown("---")
     
@@ -324,37 +349,42 @@ def main():
     st.subheader("🔴 Epidemic Weeks Timeline")
     
     # Identify epidemic weeks
-    epidemic_weeks, threshold = identify_epidemic_weeks(df, selected_years, selected_regions)
+    epidemic_weeks, threshold = identify_epidemic_weeks(year_key, region_key)
     
     st.info(f"**Epidemic Threshold:** {threshold:.0f} cases per week (90th percentile)")
     
     # Create epidemic timeline heatmap
     if not epidemic_weeks.empty:
-        # Pivot for heatmap
-        heatmap_data = yearly_weekly.pivot(
-            index='data_year',
-            columns='week_number',
-            values='cases'
-        ).fillna(0)
+        # Dense year x week matrix scattered straight from the weekly totals
+        heatmap_years, year_idx = np.unique(yearly_weekly['data_year'].to_numpy(), return_inverse=True)
+        heatmap_weeks, week_idx = np.unique(yearly_weekly['week_number'].to_numpy(), return_inverse=True)
+        heatmap_z = np.zeros((heatmap_years.size, heatmap_weeks.size), dtype=np.float64)
+        np.add.at(heatmap_z, (year_idx, week_idx), yearly_weekly['cases'].to_numpy(dtype=np.float64))
         
         # Create heatmap
-        fig_heatmap = px.imshow(
-            heatmap_data,
-            labels=dict(x="Week Number", y="Year", color="Cases"),
-            x=heatmap_data.columns,
-            y=heatmap_data.index,
-            color_continuous_scale='YlOrRd',
-            title="<b>Weekly Cases Heatmap (All Years)</b>",
-            aspect='auto'
-        )
+        fig_heatmap = go.Figure(go.Heatmap(
+            z=heatmap_z,
+            x=heatmap_weeks,
+            y=heatmap_years,
+            colorscale='YlOrRd',
+            colorbar=dict(title='Cases'),
+            hovertemplate='Week Number: %{x}<br>Year: %{y}<br>Cases: %{z}<extra></extra>'
+        ))
         
         fig_heatmap.update_layout(
+            title="<b>Weekly Cases Heatmap (All Years)</b>",
             height=400,
             xaxis_title="Week Number",
             yaxis_title="Year"
         )
         
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        # Read-only overview: render static, without the interactive layer
+        st.plotly_chart(
+            fig_heatmap,
+            use_container_width=True,
+            key='epidemic_heatmap',
+            config={'staticPlot': True, 'displayModeBar': False}
+        )
         
         # Display epidemic weeks table (limit to top 20 for size)
         st.subheader("📋 Top 20 Epidemic Weeks")
@@ -437,11 +467,14 @@ def main():
     with insight_col2:
         # Compare years
         if len(selected_years) > 1:
-            recent_year = max(selected_years)
-            prev_year = sorted(selected_years)[-2] if len(selected_years) > 1 else recent_year - 1
+            # year_key is already sorted ascending
+            recent_year = year_key[-1]
+            prev_year = year_key[-2] if len(year_key) > 1 else recent_year - 1
             
-            recent_total = yearly_weekly[yearly_weekly['data_year'] == recent_year]['cases'].sum()
-            prev_total = yearly_weekly[yearly_weekly['data_year'] == prev_year]['cases'].sum()
+            # Annual totals from one grouped pass over the weekly totals
+            totals_by_year = yearly_weekly.groupby('data_year', observed=True)['cases'].sum()
+            recent_total = totals_by_year.get(recent_year, 0)
+            prev_total = totals_by_year.get(prev_year, 0)
             
             change = ((recent_total - prev_total) / prev_total * 100) if prev_total > 0 else 0
             
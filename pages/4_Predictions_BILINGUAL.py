@@ -20,7 +20,7 @@ BILINGUAL SUPPORT: Full English/French translation
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
+import pyarrow as pa
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import warnings
@@ -90,92 +90,340 @@ st.markdown("""
 # CACHED DATA LOADING
 # ============================================================================
 
+# Typed Parquet sibling written by prepare_parquet.py; CSV is the fallback
+PARQUET_PATH = 'cleaned_data/ml_final_100pct_geometry.parquet'
+CSV_PATH = 'cleaned_data/ml_final_100pct_geometry.csv'
+
+# Per-district p50/p75/p90 weekly cases, also written by prepare_parquet.py
+QUANTILES_PATH = 'cleaned_data/district_quantiles.parquet'
+
+# Columns consumed by this page and their dtypes (applied at parse time)
+USED_COLS = ['data_year', 'week_number', 'region', 'district_clean', 'cases']
+
+# Narrow projection for the current period and the region choices
+PERIOD_COLS = ['data_year', 'week_number', 'region']
+DTYPES = {
+    'data_year': 'int16',
+    'week_number': 'int8',
+    'region': 'category',
+    'district_clean': 'category'
+}
+
+
 @st.cache_data(ttl=3600)
 def load_main_dataset():
-    """Load primary dataset"""
+    """Load primary dataset (Parquet, falling back to the CSV)"""
+    df = None
+    if os.path.exists(PARQUET_PATH):
+        try:
+            # Dtypes are stored in the Parquet schema
+            df = pd.read_parquet(PARQUET_PATH, columns=USED_COLS, engine='pyarrow')
+        except (OSError, pa.ArrowInvalid) as e:
+            st.warning(f"⚠️ {get_text('error_loading_data', lang)}: {str(e)}")
+    
     try:
-        df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-        df['data_year'] = df['data_year'].astype('int16')
-        df['week_number'] = df['week_number'].astype('int8')
-        if 'region' in df.columns:
-            df['region'] = df['region'].astype('category')
-        if 'district_clean' in df.columns:
-            df['district_clean'] = df['district_clean'].astype('category')
+        if df is None:
+            df = pd.read_csv(
+                CSV_PATH,
+                engine='pyarrow',
+                usecols=USED_COLS,
+                dtype=DTYPES
+            )
+        
+        # Weekly counts are whole numbers: smallest unsigned int that fits
+        df['cases'] = pd.to_numeric(df['cases'], downcast='unsigned')
         return df
-    except:
+    except Exception as e:
+        st.error(f"{get_text('error_loading_data', lang)}: {str(e)}")
+        return pd.DataFrame()
+
+
+@st.cache_data(ttl=3600)
+def load_region_rows(selected_regions: tuple):
+    """
+    Rows for the selected regions only
+    
+    The region predicate is pushed into the Parquet reader so only
+    matching rows are materialized in pandas.
+    """
+    if os.path.exists(PARQUET_PATH):
         try:
-            df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-            df['data_year'] = df['data_year'].astype('int16')
-            df['week_number'] = df['week_number'].astype('int8')
-            if 'region' in df.columns:
-                df['region'] = df['region'].astype('category')
-            if 'district_clean' in df.columns:
-                df['district_clean'] = df['district_clean'].astype('category')
+            df = pd.read_parquet(
+                PARQUET_PATH,
+                columns=USED_COLS,
+                engine='pyarrow',
+                filters=[('region', 'in', list(selected_regions))]
+            )
+            df['cases'] = pd.to_numeric(df['cases'], downcast='unsigned')
             return df
-        except Exception as e:
-            st.error(f"{get_text('error_loading_data', lang)}: {str(e)}")
-            return pd.DataFrame()
+        except (OSError, pa.ArrowInvalid) as e:
+            st.warning(f"⚠️ {get_text('error_loading_data', lang)}: {str(e)}")
+    
+    df = load_main_dataset()
+    if df.empty:
+        return df
+    return df[df['region'].isin(selected_regions)]
+
+
+@st.cache_data(ttl=3600)
+def load_period_columns():
+    """
+    Year, week and region columns only
+    
+    A narrow projected read for the current period and the region choices,
+    so the page never holds the full dataset next to the region rows.
+    """
+    if os.path.exists(PARQUET_PATH):
+        try:
+            return pd.read_parquet(PARQUET_PATH, columns=PERIOD_COLS, engine='pyarrow')
+        except (OSError, pa.ArrowInvalid) as e:
+            st.warning(f"⚠️ {get_text('error_loading_data', lang)}: {str(e)}")
+    
+    df = load_main_dataset()
+    return df[PERIOD_COLS] if not df.empty else df
+
+
+@st.cache_data(ttl=3600)
+def get_current_period():
+    """Most recent (year, week) in the data, or None if it failed to load"""
+    df = load_period_columns()
+    if df.empty:
+        return None
+    
+    current_year = int(df['data_year'].max())
+    current_week = int(df.loc[df['data_year'] == current_year, 'week_number'].max())
+    return current_year, current_week
+
+
+@st.cache_data(ttl=3600)
+def get_available_regions():
+    """Sidebar region choices (read from the category index, not the rows)"""
+    df = load_period_columns()
+    return df['region'].cat.categories.sort_values().tolist()
+
+
+@st.cache_data(ttl=3600)
+def load_district_quantiles():
+    """Historical p50/p75/p90 weekly cases per district (risk thresholds)"""
+    if os.path.exists(QUANTILES_PATH):
+        try:
+            return pd.read_parquet(QUANTILES_PATH, engine='pyarrow')
+        except (OSError, pa.ArrowInvalid) as e:
+            st.warning(f"⚠️ {get_text('error_loading_data', lang)}: {str(e)}")
+    
+    # Not materialized yet: derive them from the full history
+    df = load_main_dataset()
+    quantiles = df.groupby('district_clean', observed=True)['cases'].quantile(
+        [0.50, 0.75, 0.90]
+    ).unstack()
+    quantiles.columns = ['p50', 'p75', 'p90']
+    quantiles.index = quantiles.index.astype(str)
+    return quantiles
 
 
 # ============================================================================
 # PREDICTION FUNCTIONS
 # ============================================================================
 
-def make_simple_prediction(df, district, weeks_ahead):
+def make_simple_predictions(df, weeks_ahead):
     """
-    Simple statistical prediction based on recent trends
+    Simple statistical prediction based on recent trends, for all districts
     
-    Uses 12-week rolling average with trend adjustment
-    """
-    district_data = df[df['district_clean'] == district].copy()
+    Uses 12-week rolling average with trend adjustment. Vectorized over
+    districts on the integer category codes: one lexsort, then window sums
+    read off a cumulative sum at each district's boundary.
     
-    if len(district_data) < 12:
-        return None
-    
-    # Get most recent data
-    recent_data = district_data.nlargest(12, ['data_year', 'week_number'])
+    Returns:
+        Series of predicted cases indexed by district (districts with
+        fewer than 12 weeks of history are omitted)
+    """
+    if df.empty:
+        return pd.Series(dtype=float, index=pd.Index([], name='district_clean'))
+    
+    districts = df['district_clean'].array
+    codes = districts.codes
+    order = np.lexsort((df['week_number'].to_numpy(), df['data_year'].to_numpy(), codes))
+    codes = codes[order]
+    cases = df['cases'].to_numpy(dtype=np.float64)[order]
+    
+    # Each district's rows are now contiguous; keep those with 12+ weeks
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], codes.size]
+    has_history = (ends - starts) >= 12
+    ends = ends[has_history]
+    
+    # Sums over the last 12 / last 4 / previous 8 weeks of each district
+    cumulative = np.r_[0.0, np.cumsum(cases)]
+    last_12 = cumulative[ends] - cumulative[ends - 12]
+    recent_4 = cumulative[ends] - cumulative[ends - 4]
+    previous_8 = last_12 - recent_4
     
     # Calculate average
-    avg_cases = recent_data['cases'].mean()
+    avg_cases = last_12 / 12
     
     # Calculate trend (last 4 weeks vs previous 8 weeks)
-    if len(recent_data) >= 12:
-        recent_4 = recent_data.nlargest(4, ['data_year', 'week_number'])['cases'].mean()
-        previous_8 = recent_data.nlargest(12, ['data_year', 'week_number']).nsmallest(8, ['data_year', 'week_number'])['cases'].mean()
-        
-        if previous_8 > 0:
-            trend_factor = recent_4 / previous_8
-        else:
-            trend_factor = 1.0
-    else:
-        trend_factor = 1.0
+    trend_factor = np.ones_like(avg_cases)
+    np.divide(recent_4 / 4, previous_8 / 8, out=trend_factor, where=previous_8 > 0)
     
     # Apply trend with dampening for longer horizons
     dampening = 1.0 - (weeks_ahead - 1) * 0.05  # Reduce trend effect for longer predictions
     dampening = max(dampening, 0.7)  # Minimum 70% of trend
     
-    predicted = avg_cases * (trend_factor ** dampening)
+    # One-week horizon is undampened: the power would be the identity
+    if dampening != 1.0:
+        np.power(trend_factor, dampening, out=trend_factor)
+    
+    predicted = np.clip(avg_cases * trend_factor, 0, None)
+    
+    # Back to district names only for the result index
+    district_names = districts.categories.take(codes[starts[has_history]])
+    return pd.Series(predicted, index=pd.Index(district_names, name='district_clean'))
+
+
+# Risk buckets ordered by how many historical percentiles are exceeded
+RISK_LEVELS = [
+    ('🟢', 'low_risk', 'risk-low', '#28A745'),
+    ('🟡', 'moderate_risk', 'risk-moderate', '#17A2B8'),
+    ('🟠', 'high_risk', 'risk-high', '#FFC107'),
+    ('🔴', 'critical_risk', 'risk-critical', '#DC3545')
+]
+
+
+def classify_risk_levels(predicted_cases, quantiles, lang='en'):
+    """
+    Classify predicted risk level based on historical distribution
+    
+    Vectorized over districts: the bucket is the number of the district's
+    historical p50/p75/p90 thresholds the prediction exceeds.
+    
+    Args:
+        predicted_cases: Series of predictions indexed by district
+        quantiles: DataFrame of p50/p75/p90 indexed by district
+        lang: Language code
+        
+    Returns:
+        DataFrame indexed by district with risk_level, risk_class, risk_color
+    """
+    percentiles = quantiles.reindex(predicted_cases.index.astype(str))
     
-    return max(0, predicted)
+    predicted = predicted_cases.to_numpy()
+    bucket = (
+        (predicted > percentiles['p50'].to_numpy()).astype(np.int8)
+        + (predicted > percentiles['p75'].to_numpy())
+        + (predicted > percentiles['p90'].to_numpy())
+    )
+    
+    labels = np.array([f"{icon} {get_text(key, lang)}" for icon, key, _, _ in RISK_LEVELS], dtype=object)
+    classes = np.array([css for _, _, css, _ in RISK_LEVELS], dtype=object)
+    colors = np.array([color for _, _, _, color in RISK_LEVELS], dtype=object)
+    
+    return pd.DataFrame({
+        'risk_level': labels[bucket],
+        'risk_class': classes[bucket],
+        'risk_color': colors[bucket]
+    }, index=predicted_cases.index)
+
+
+@st.cache_data(ttl=3600)
+def compute_predictions(selected_regions: tuple, weeks_ahead, lang='en'):
+    """
+    Predictions and risk levels for every district in the selected regions
+    
+    Cached on (regions, horizon, language) so table sorting and other
+    widget reruns do not repeat the per-district prediction loop.
+    """
+    # Only the selected regions' rows, filtered at read time
+    region_df = load_region_rows(selected_regions)
+    
+    # Predictions for every district in the selected regions at once
+    district_predictions = make_simple_predictions(region_df, weeks_ahead)
+    
+    # Risk levels for all districts from precomputed historical percentiles
+    district_risk = classify_risk_levels(district_predictions, load_district_quantiles(), lang)
+    district_region = region_df.groupby('district_clean', observed=True)['region'].first()
+    
+    # Translated column labels resolved once, columns assembled in one pass
+    labels = {key: get_text(key, lang) for key in ['district', 'region', 'predicted_cases', 'risk_level']}
+    districts = district_predictions.index
+    
+    return pd.DataFrame({
+        labels['district']: districts.to_numpy(dtype=object),
+        labels['region']: district_region.reindex(districts).to_numpy(dtype=object),
+        labels['predicted_cases']: district_predictions.to_numpy(dtype=float).round(1),
+        labels['risk_level']: district_risk['risk_level'].to_numpy(),
+        'risk_class': district_risk['risk_class'].to_numpy(),
+        'risk_color': district_risk['risk_color'].to_numpy()
+    })
+
+
+@st.cache_data(ttl=3600)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """UTF-8 CSV for the download button, encoded once per table contents"""
+    return df.to_csv(index=False).encode('utf-8')
 
 
-def classify_risk_level(predicted_cases, district_data, lang='en'):
-    """Classify predicted risk level based on historical distribution"""
+# ============================================================================
+# PAGE SECTIONS (fragments: rerun on their own, not with the whole page)
+# ============================================================================
+
+@st.fragment
+def render_predictions_table(predictions_df, weeks_ahead, lang):
+    """Sortable district predictions table with CSV download"""
+    district_label = get_text('district', lang)
+    region_label = get_text('region', lang)
+    predicted_label = get_text('predicted_cases', lang)
+    risk_label = get_text('risk_level', lang)
+    week_label = get_text('week', lang) if lang == 'en' else 'semaines'
     
-    # Calculate percentiles from historical data
-    cases_series = district_data['cases']
-    p50 = cases_series.quantile(0.50)
-    p75 = cases_series.quantile(0.75)
-    p90 = cases_series.quantile(0.90)
+    st.subheader(f"📋 {get_text('district_level_predictions', lang)} ({weeks_ahead} {week_label})")
+    
+    # Sort options
+    sort_options = {
+        predicted_label: predicted_label,
+        risk_label: risk_label,
+        district_label: district_label
+    }
+    
+    sort_by = st.selectbox(
+        f"{get_text('sort_by', lang)}:",
+        options=list(sort_options.keys()),
+        index=0
+    )
     
-    if predicted_cases > p90:
-        return f"🔴 {get_text('critical_risk', lang)}", "risk-critical", "#DC3545"
-    elif predicted_cases > p75:
-        return f"🟠 {get_text('high_risk', lang)}", "risk-high", "#FFC107"
-    elif predicted_cases > p50:
-        return f"🟡 {get_text('moderate_risk', lang)}", "risk-moderate", "#17A2B8"
+    # Sort dataframe
+    if sort_by == predicted_label:
+        predictions_display = predictions_df.sort_values(predicted_label, ascending=False)
+    elif sort_by == district_label:
+        predictions_display = predictions_df.sort_values(district_label)
     else:
-        return f"🟢 {get_text('low_risk', lang)}", "risk-low", "#28A745"
+        predictions_display = predictions_df.sort_values('risk_class')
+    
+    # Display columns
+    display_cols = [district_label, region_label, predicted_label, risk_label]
+    
+    # Predicted cases drawn as in-cell bars by the grid (no Styler HTML)
+    st.dataframe(
+        predictions_display[display_cols],
+        use_container_width=True,
+        height=500,
+        column_config={
+            predicted_label: st.column_config.ProgressColumn(
+                predicted_label,
+                format='%.1f',
+                min_value=0.0,
+                max_value=max(float(predictions_display[predicted_label].max()), 1.0)
+            )
+        }
+    )
+    
+    # Download button
+    csv_data = to_csv_bytes(predictions_display[display_cols])
+    st.download_button(
+        label=f"📥 {get_text('download', lang)} {get_text('predictions', lang)} (CSV)",
+        data=csv_data,
+        file_name=f"predictions_{weeks_ahead}weeks_{lang}.csv",
+        mime="text/csv"
+    )
 
 
 # ============================================================================
@@ -188,6 +436,13 @@ def main():
     # Get language
     lang = st.session_state.get('language', 'en')
     
+    # Translated labels reused throughout the page
+    district_label = get_text('district', lang)
+    region_label = get_text('region', lang)
+    predicted_label = get_text('predicted_cases', lang)
+    risk_label = get_text('risk_level', lang)
+    week_label = get_text('week', lang) if lang == 'en' else 'semaines'
+    
     # ========================================================================
     # HEADER
     # ========================================================================
@@ -203,9 +458,9 @@ def main():
     # ========================================================================
     
     with st.spinner(f"{get_text('loading_data', lang)}"):
-        df = load_main_dataset()
+        current_period = get_current_period()
     
-    if df.empty:
+    if current_period is None:
         st.error(f"❌ {get_text('failed_load_data', lang)}")
         st.stop()
     
@@ -230,8 +485,7 @@ def main():
     st.sidebar.markdown("---")
     
     # Get current period
-    current_year = int(df['data_year'].max())
-    current_week = int(df[df['data_year'] == current_year]['week_number'].max())
+    current_year, current_week = current_period
     
     st.sidebar.info(f"""
     **{get_text('current_period', lang)}:**
@@ -241,7 +495,7 @@ def main():
     
     # Prediction horizon
     weeks_ahead = st.sidebar.slider(
-        f"{get_text('forecast_horizon', lang)} ({get_text('week', lang) if lang == 'en' else 'semaines'})",
+        f"{get_text('forecast_horizon', lang)} ({week_label})",
         min_value=1,
         max_value=12,
         value=4,
@@ -251,7 +505,7 @@ def main():
     st.sidebar.markdown("---")
     
     # Region filter
-    available_regions = sorted(df['region'].unique())
+    available_regions = get_available_regions()
     selected_regions = st.sidebar.multiselect(
         get_text('filter_by_regions', lang),
         options=available_regions,
@@ -270,34 +524,7 @@ def main():
     st.subheader(f"🔮 {get_text('district_level_predictions', lang)}")
     
     with st.spinner(f"{get_text('generating_predictions', lang)}"):
-        # Get districts in selected regions
-        districts_to_predict = df[df['region'].isin(selected_regions)]['district_clean'].unique()
-        
-        predictions = []
-        
-        for district in districts_to_predict:
-            predicted_cases = make_simple_prediction(df, district, weeks_ahead)
-            
-            if predicted_cases is not None:
-                district_data = df[df['district_clean'] == district]
-                region = district_data.iloc[0]['region']
-                
-                risk_level, risk_class, risk_color = classify_risk_level(
-                    predicted_cases, 
-                    district_data,
-                    lang
-                )
-                
-                predictions.append({
-                    get_text('district', lang): district,
-                    get_text('region', lang): region,
-                    get_text('predicted_cases', lang): round(predicted_cases, 1),
-                    get_text('risk_level', lang): risk_level,
-                    'risk_class': risk_class,
-                    'risk_color': risk_color
-                })
-        
-        predictions_df = pd.DataFrame(predictions)
+        predictions_df = compute_predictions(tuple(sorted(selected_regions)), weeks_ahead, lang)
     
     if predictions_df.empty:
         st.warning(f"⚠️ {get_text('no_predictions', lang)}")
@@ -311,14 +538,14 @@ def main():
     
     col1, col2, col3, col4 = st.columns(4)
     
-    total_predicted = predictions_df[get_text('predicted_cases', lang)].sum()
+    total_predicted = predictions_df[predicted_label].sum()
     critical_count = sum(predictions_df['risk_class'] == 'risk-critical')
     high_count = sum(predictions_df['risk_class'] == 'risk-high')
     moderate_count = sum(predictions_df['risk_class'] == 'risk-moderate')
     
     with col1:
         st.metric(
-            get_text('total', lang) + ' ' + get_text('predicted_cases', lang),
+            get_text('total', lang) + ' ' + predicted_label,
             f"{total_predicted:,.0f}"
         )
     
@@ -346,50 +573,7 @@ def main():
     # PREDICTIONS TABLE
     # ========================================================================
     
-    st.subheader(f"📋 {get_text('district_level_predictions', lang)} ({weeks_ahead} {get_text('week', lang) if lang == 'en' else 'semaines'})")
-    
-    # Sort options
-    sort_options = {
-        get_text('predicted_cases', lang): get_text('predicted_cases', lang),
-        get_text('risk_level', lang): get_text('risk_level', lang),
-        get_text('district', lang): get_text('district', lang)
-    }
-    
-    sort_by = st.selectbox(
-        f"{get_text('sort_by', lang)}:",
-        options=list(sort_options.keys()),
-        index=0
-    )
-    
-    # Sort dataframe
-    if sort_by == get_text('predicted_cases', lang):
-        predictions_display = predictions_df.sort_values(get_text('predicted_cases', lang), ascending=False)
-    elif sort_by == get_text('district', lang):
-        predictions_display = predictions_df.sort_values(get_text('district', lang))
-    else:
-        predictions_display = predictions_df.sort_values('risk_class')
-    
-    # Display columns
-    display_cols = [get_text('district', lang), get_text('region', lang), 
-                    get_text('predicted_cases', lang), get_text('risk_level', lang)]
-    
-    # Style the dataframe
-    st.dataframe(
-        predictions_display[display_cols].style
-        .background_gradient(subset=[get_text('predicted_cases', lang)], cmap='YlOrRd')
-        .format({get_text('predicted_cases', lang): '{:.1f}'}),
-        use_container_width=True,
-        height=500
-    )
-    
-    # Download button
-    csv_data = predictions_display[display_cols].to_csv(index=False).encode('utf-8')
-    st.download_button(
-        label=f"📥 {get_text('download', lang)} {get_text('predictions', lang)} (CSV)",
-        data=csv_data,
-        file_name=f"predictions_{weeks_ahead}weeks_{lang}.csv",
-        mime="text/csv"
-    )
+    render_predictions_table(predictions_df, weeks_ahead, lang)
     
     st.markdown("---")
     
@@ -402,20 +586,26 @@ def main():
     high_risk = predictions_df[predictions_df['risk_class'].isin(['risk-critical', 'risk-high'])]
     
     if not high_risk.empty:
-        high_risk_sorted = high_risk.sort_values(get_text('predicted_cases', lang), ascending=False).head(10)
+        high_risk_sorted = high_risk.sort_values(predicted_label, ascending=False).head(10)
         
-        fig = px.bar(
-            high_risk_sorted,
-            x=get_text('predicted_cases', lang),
-            y=get_text('district', lang),
+        fig = go.Figure(go.Bar(
+            x=high_risk_sorted[predicted_label],
+            y=high_risk_sorted[district_label],
             orientation='h',
-            color='risk_color',
-            color_discrete_map='identity',
-            title=f"<b>{get_text('top_districts', lang)} (10) - {get_text('predicted_cases', lang)}</b>",
-            hover_data=[get_text('region', lang), get_text('risk_level', lang)]
-        )
+            marker=dict(color=high_risk_sorted['risk_color']),
+            customdata=high_risk_sorted[[region_label, risk_label]].to_numpy(),
+            hovertemplate=(
+                f'{district_label}=%{{y}}<br>'
+                f'{predicted_label}=%{{x}}<br>'
+                f'{region_label}=%{{customdata[0]}}<br>'
+                f'{risk_label}=%{{customdata[1]}}<extra></extra>'
+            )
+        ))
         
         fig.update_layout(
+            title=f"<b>{get_text('top_districts', lang)} (10) - {predicted_label}</b>",
+            xaxis_title=predicted_label,
+            yaxis_title=district_label,
             height=400,
             showlegend=False,
             yaxis={'categoryorder': 'total ascending'}
@@ -432,42 +622,50 @@ def main():
     st.markdown("---")
     st.subheader(f"🌍 {get_text('regional_distribution', lang)} - {get_text('predictions', lang)}")
     
-    regional_summary = predictions_df.groupby(get_text('region', lang)).agg({
-        get_text('predicted_cases', lang): 'sum',
-        get_text('district', lang): 'count'
-    }).reset_index()
-    
-    regional_summary.columns = [
-        get_text('region', lang),
-        get_text('predicted_cases', lang),
-        get_text('districts', lang) if lang == 'en' else 'Districts'
-    ]
+    # One district per row: per-region sums and counts via bincount on codes
+    region_codes = pd.Categorical(predictions_df[region_label])
+    regional_summary = pd.DataFrame({
+        region_label: region_codes.categories,
+        predicted_label: np.bincount(region_codes.codes, weights=predictions_df[predicted_label].to_numpy()),
+        get_text('districts', lang) if lang == 'en' else 'Districts': np.bincount(region_codes.codes)
+    })
     
-    regional_summary = regional_summary.sort_values(get_text('predicted_cases', lang), ascending=False)
+    regional_summary = regional_summary.sort_values(predicted_label, ascending=False)
     
     # Display regional summary
     st.dataframe(
-        regional_summary.style
-        .background_gradient(subset=[get_text('predicted_cases', lang)], cmap='YlOrRd')
-        .format({get_text('predicted_cases', lang): '{:.1f}'}),
-        use_container_width=True
+        regional_summary,
+        use_container_width=True,
+        column_config={
+            predicted_label: st.column_config.ProgressColumn(
+                predicted_label,
+                format='%.1f',
+                min_value=0.0,
+                max_value=max(float(regional_summary[predicted_label].max()), 1.0)
+            )
+        }
     )
     
     # Regional chart
-    fig_regional = px.bar(
-        regional_summary,
-        x=get_text('predicted_cases', lang),
-        y=get_text('region', lang),
+    fig_regional = go.Figure(go.Bar(
+        x=regional_summary[predicted_label],
+        y=regional_summary[region_label],
         orientation='h',
-        color=get_text('predicted_cases', lang),
-        color_continuous_scale='YlOrRd',
-        title=f"<b>{get_text('predicted_cases', lang)} - {get_text('region', lang)}</b>",
-        text=get_text('predicted_cases', lang)
+        marker=dict(color=regional_summary[predicted_label], colorscale='YlOrRd', showscale=True),
+        text=regional_summary[predicted_label],
+        texttemplate='%{text:.0f}',
+        textposition='outside',
+        hovertemplate=f'{region_label}=%{{y}}<br>{predicted_label}=%{{x}}<extra></extra>'
+    ))
+    
+    fig_regional.update_layout(
+        title=f"<b>{predicted_label} - {region_label}</b>",
+        xaxis_title=predicted_label,
+        yaxis_title=region_label,
+        height=400,
+        showlegend=False
     )
     
-    fig_regional.update_traces(texttemplate='%{text:.0f}', textposition='outside')
-    fig_regional.update_layout(height=400, showlegend=False)
-    
     st.plotly_chart(fig_regional, use_container_width=True)
     
     # ========================================================================
@@ -475,7 +673,7 @@ def main():
     # ========================================================================
     
     st.markdown("---")
-    st.caption(f"**{get_text('forecast_horizon', lang)}:** {weeks_ahead} {get_text('week', lang) if lang == 'en' else 'semaines'} | **{get_text('regions', lang)}:** {len(selected_regions)}")
+    st.caption(f"**{get_text('forecast_horizon', lang)}:** {weeks_ahead} {week_label} | **{get_text('regions', lang)}:** {len(selected_regions)}")
     st.caption(f"**{get_text('total', lang)} {get_text('districts', lang)}:** {len(predictions_df)}")
 
 
@@ -22,12 +22,17 @@ Target Audience: Proactive planning, resource allocation, early intervention
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+# Shared dataset loader (one cache entry across pages)
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import load_main_dataset, category_code_mask
+
 # Try to import pickle for model loading
 try:
     import pickle
@@ -106,21 +111,25 @@ st.markdown("""
 # CACHED DATA LOADING
 # ============================================================================
 
+# Columns consumed by this page (forecasting and feature preparation)
+USED_COLS = ['data_year', 'week_number', 'region', 'district_clean', 'cases', 'population', 'region_encoded']
+
+
 @st.cache_data(ttl=3600)
-def load_main_dataset():
-    """Load primary dataset"""
-    try:
-        df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-        df['data_year'] = df['data_year'].astype('int16')
-        df['week_number'] = df['week_number'].astype('int8')
-        if 'region' in df.columns:
-            df['region'] = df['region'].astype('category')
-        if 'district_clean' in df.columns:
-            df['district_clean'] = df['district_clean'].astype('category')
+def load_prediction_data():
+    """Columns used by this page from the shared dataset, numerically downcast"""
+    df = load_main_dataset()
+    if df.empty:
         return df
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return pd.DataFrame()
+    
+    df = df[USED_COLS].copy()
+    
+    # Narrow numeric columns: weekly counts are whole numbers, district
+    # populations fit float32 exactly, region codes fit a small int
+    df['cases'] = pd.to_numeric(df['cases'], downcast='unsigned')
+    df['population'] = pd.to_numeric(df['population'], downcast='float')
+    df['region_encoded'] = pd.to_numeric(df['region_encoded'], downcast='integer')
+    return df
 
 
 @st.cache_resource
@@ -132,32 +141,47 @@ def load_ml_model(model_type='regression'):
         model_type: 'regression' or 'classification'
         
     Returns:
-        Loaded model or None if not available
+        Loaded XGBRegressor/XGBClassifier (sklearn API) or None if not available
     """
+    if model_type == 'regression':
+        model_path = 'cleaned_data/model_results/best_regression_model.pkl'
+    else:
+        model_path = 'cleaned_data/model_results/best_classification_model.pkl'
+    
+    # Preferred: XGBoost native binary (UBJSON) export, no pickle involved.
+    # Loaded into the sklearn wrapper so callers get the same predict API
+    # as the pickled estimators.
+    native_path = model_path.replace('.pkl', '.ubj')
+    if os.path.exists(native_path):
+        try:
+            import xgboost as xgb
+            model = xgb.XGBRegressor() if model_type == 'regression' else xgb.XGBClassifier()
+            model.load_model(native_path)
+            return model
+        except (ImportError, OSError, ValueError) as e:
+            # xgb.core.XGBoostError subclasses ValueError
+            st.warning(f" Could not load {native_path}: {str(e)[:100]}")
+    
     if not PICKLE_AVAILABLE:
         return None
     
     try:
-        if model_type == 'regression':
-            model_path = 'cleaned_data/model_results/best_regression_model.pkl'
-        else:
-            model_path = 'cleaned_data/model_results/best_classification_model.pkl'
-        
-        # Try different loading methods for compatibility
+        # Try different loading methods for compatibility (legacy files)
         try:
             # Method 1: Standard pickle load
             with open(model_path, 'rb') as f:
                 model = pickle.load(f)
         except Exception as e1:
             try:
-                # Method 2: Joblib (if model was saved with joblib)
+                # Method 2: Joblib (if model was saved with joblib);
+                # arrays are memory-mapped instead of copied
                 import joblib
-                model = joblib.load(model_path)
+                model = joblib.load(model_path, mmap_mode='r')
             except Exception as e2:
                 try:
-                    # Method 3: XGBoost native load (if it's an XGBoost model)
+                    # Method 3: XGBoost JSON export
                     import xgboost as xgb
-                    model = xgb.Booster()
+                    model = xgb.XGBRegressor() if model_type == 'regression' else xgb.XGBClassifier()
                     model.load_model(model_path.replace('.pkl', '.json'))
                 except Exception as e3:
                     # All methods failed
@@ -200,111 +224,220 @@ def load_feature_scaler():
 # PREDICTION FUNCTIONS
 # ============================================================================
 
-def prepare_features_for_prediction(df, district, current_year, current_week):
+def prepare_features_for_prediction(df, current_year, current_week):
     """
-    Prepare features for prediction
+    Prepare features for prediction, for all districts at once
     
-    This creates the same features used during model training
-    """
-    # Filter to specific district
-    district_data = df[df['district_clean'] == district].copy()
+    This creates the same features used during model training. Lags and
+    rolling statistics are computed over the whole recent window with
+    grouped shift/rolling, then read off each district's latest week.
     
-    # Sort by time
-    district_data = district_data.sort_values(['data_year', 'week_number'])
+    Returns:
+        DataFrame of features indexed by district (districts with fewer
+        than 4 recent weeks are omitted)
+    """
+    # Sort by time within each district
+    df = df.sort_values(['district_clean', 'data_year', 'week_number'])
+    
+    # Get recent data (current year up to the current week, plus last year)
+    recent_data = df[
+        ((df['data_year'] == current_year) & 
+         (df['week_number'] <= current_week)) |
+        (df['data_year'] == current_year - 1)
+    ]
+    cases = recent_data['cases'].astype('float64')
+    by_district = cases.groupby(recent_data['district_clean'], observed=True, sort=False)
+    
+    # Lag features and rolling averages, aligned to each row
+    features = pd.DataFrame({
+        'week_number': current_week + 1,  # Predicting next week
+        'data_year': current_year,
+        'cases_lag_1w': cases,
+        'cases_lag_2w': by_district.shift(1),
+        'cases_lag_4w': by_district.shift(3),
+        'cases_rolling_mean_2w': by_district.rolling(2).mean().droplevel(0),
+        'cases_rolling_mean_4w': by_district.rolling(4).mean().droplevel(0),
+        'cases_rolling_std_4w': by_district.rolling(4).std().droplevel(0),
+        'district_clean': recent_data['district_clean']
+    })
+    
+    # Latest week of every district with enough data
+    enough_data = by_district.transform('size') >= 4
+    latest = features[enough_data].groupby('district_clean', observed=True, sort=False).tail(1)
+    latest = latest.set_index('district_clean')
+    
+    # Region encoding and population (latest record of each district)
+    district_info = df.groupby('district_clean', observed=True, sort=False).tail(1).set_index('district_clean')
+    for col in ['region_encoded', 'population']:
+        if col in district_info.columns:
+            latest[col] = district_info[col]
+    
+    return latest
+
+
+def make_simple_predictions(df, weeks_ahead=4):
+    """
+    Make simple statistical predictions for every district without ML model
     
-    # Get recent data (last 8 weeks for lag features)
-    recent_data = district_data[
-        ((district_data['data_year'] == current_year) & 
-         (district_data['week_number'] <= current_week)) |
-        (district_data['data_year'] == current_year - 1)
-    ].tail(10)
+    Uses historical average and trend. Each district's last 12 weeks are
+    packed into one row of a (districts x 12) array, and the averages and
+    trend are computed for all rows at once.
     
-    if len(recent_data) < 4:
-        return None  # Not enough data
+    Returns:
+        Series of predicted cases indexed by district (districts with
+        fewer than 4 weeks of data are omitted)
+    """
+    # Get recent trend (last 12 weeks of each district), sliced straight
+    # from a numpy view of the cases column
+    by_district = df.groupby('district_clean', observed=True, sort=False)
+    district_size = by_district.size()
+    from_end = by_district.cumcount(ascending=False).to_numpy()
+    in_window = from_end < 12
+    group = by_district.ngroup().to_numpy()[in_window]
+    lengths = np.minimum(district_size.to_numpy(), 12)
+    
+    # Pack the windows left-aligned, padding short histories with NaN
+    window = np.full((len(district_size), 12), np.nan)
+    window[group, lengths[group] - 1 - from_end[in_window]] = df['cases'].to_numpy()[in_window]
+    
+    # Keep districts with at least 4 weeks of data
+    has_data = lengths >= 4
+    window = window[has_data]
+    lengths = lengths[has_data]
     
-    # Extract basic features
-    features = {
-        'week_number': current_week + 1,  # Predicting next week
-        'data_year': current_year,
-    }
+    # Simple prediction: average of last 4 weeks
+    last_4 = np.take_along_axis(window, lengths[:, None] - 4 + np.arange(4), axis=1)
+    newer_avg = last_4.mean(axis=1)
+    predicted_cases = newer_avg.copy()
+    
+    # Adjust for trend (half the trend, once there are 8+ weeks)
+    older_avg = window[:, :4].mean(axis=1)
+    trend = newer_avg - older_avg
+    with_trend = lengths >= 8
+    predicted_cases[with_trend] += trend[with_trend] * 0.5
+    
+    predicted_cases = np.maximum(predicted_cases, 0)  # No negative predictions
+    return pd.Series(predicted_cases, index=district_size.index[has_data])
+
+
+@st.cache_data(ttl=3600)
+def district_thresholds():
+    """
+    Historical risk thresholds (50th/75th/90th percentile cases) per district
     
-    # Lag features (if available in recent data)
-    if len(recent_data) >= 1:
-        features['cases_lag_1w'] = recent_data.iloc[-1]['cases']
-    if len(recent_data) >= 2:
-        features['cases_lag_2w'] = recent_data.iloc[-2]['cases']
-    if len(recent_data) >= 4:
-        features['cases_lag_4w'] = recent_data.iloc[-4]['cases']
+    Computed once from the full dataset and cached across reruns. Cases are
+    sorted once by (district, cases) and the three percentiles of every
+    district are interpolated from that array in one pass (numpy's default
+    linear method, same values as pandas .quantile).
+    """
+    df = load_prediction_data()
+    districts = df['district_clean']
+    cases = df['cases'].to_numpy(dtype='float64')
+    codes = districts.cat.codes.to_numpy()
+    
+    # Missing cases are skipped, as in pandas .quantile
+    valid = ~np.isnan(cases)
+    cases, codes = cases[valid], codes[valid]
+    
+    sorted_cases = cases[np.lexsort((cases, codes))]
+    counts = np.bincount(codes, minlength=len(districts.cat.categories))
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    counts, starts = counts[present], starts[present]
+    
+    # Fractional rank of each percentile within its district's sorted cases
+    position = np.array([0.50, 0.75, 0.90]) * (counts[:, None] - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    lower_value = sorted_cases[starts[:, None] + lower]
+    upper_value = sorted_cases[starts[:, None] + upper]
+    
+    return pd.DataFrame(
+        lower_value + (upper_value - lower_value) * (position - lower),
+        index=districts.cat.categories[present],
+        columns=['p50', 'p75', 'p90']
+    )
+
+
+@st.cache_data(ttl=3600)
+def district_region_lookup():
+    """Region of each district (static map, built once from the full dataset)"""
+    df = load_prediction_data()
+    lookup = df.drop_duplicates('district_clean').set_index('district_clean')['region']
+    lookup.index = lookup.index.astype(str)
+    return lookup.astype(str)
+
+
+# Risk levels from lowest to highest (order of the Risk Level categorical)
+RISK_LEVEL_ORDER = ['🟢 Low', '🟡 Moderate', '🟠 High', '🔴 Critical']
+
+
+def classify_risk_levels(predicted_cases, thresholds):
+    """
+    Classify outbreak risk based on predicted cases, for all districts
     
-    # Rolling averages
-    if len(recent_data) >= 2:
-        features['cases_rolling_mean_2w'] = recent_data.tail(2)['cases'].mean()
-    if len(recent_data) >= 4:
-        features['cases_rolling_mean_4w'] = recent_data.tail(4)['cases'].mean()
-        features['cases_rolling_std_4w'] = recent_data.tail(4)['cases'].std()
+    Args:
+        predicted_cases: Series of predicted cases indexed by district
+        thresholds: Per-district p50/p75/p90 from district_thresholds()
+        
+    Returns:
+        Arrays of risk levels, risk classes and colors
+    """
+    limits = thresholds.reindex(predicted_cases.index)
+    predicted = predicted_cases.to_numpy()
     
-    # Region encoding (if available)
-    if 'region_encoded' in district_data.columns:
-        features['region_encoded'] = district_data.iloc[-1]['region_encoded']
+    conditions = [
+        predicted > limits['p90'].to_numpy(),
+        predicted > limits['p75'].to_numpy(),
+        predicted > limits['p50'].to_numpy()
+    ]
     
-    # Population
-    if 'population' in district_data.columns:
-        features['population'] = district_data.iloc[-1]['population']
+    risk_levels = np.select(conditions, ['🔴 Critical', '🟠 High', '🟡 Moderate'], default='🟢 Low')
+    risk_classes = np.select(conditions, ['risk-critical', 'risk-high', 'risk-moderate'], default='risk-low')
+    risk_colors = np.select(conditions, ['#DC3545', '#FFC107', '#17A2B8'], default='#28A745')
     
-    return features
+    return risk_levels, risk_classes, risk_colors
 
 
-def make_simple_prediction(df, district, weeks_ahead=4):
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_predictions(selected_regions: tuple, weeks_ahead):
     """
-    Make simple statistical prediction without ML model
+    Predictions and risk levels for every district in the selected regions
     
-    Uses historical average and trend
+    Cached on (regions, horizon) so the top-N slider, downloads and other
+    widget reruns do not regenerate the predictions.
     """
-    district_data = df[df['district_clean'] == district].copy()
+    df = load_prediction_data()
     
-    # Get recent trend (last 12 weeks)
-    recent = district_data.tail(12)
+    # Rows of the selected regions, predicted for all districts at once
+    region_df = df[category_code_mask(df['region'], selected_regions)].assign(
+        region=lambda d: d['region'].cat.remove_unused_categories(),
+        district_clean=lambda d: d['district_clean'].cat.remove_unused_categories()
+    )
+    district_predictions = make_simple_predictions(region_df, weeks_ahead)
     
-    if len(recent) < 4:
-        return None
+    # Classify risk against the cached per-district thresholds
+    risk_levels, risk_classes, risk_colors = classify_risk_levels(district_predictions, district_thresholds())
     
-    # Simple prediction: average of last 4 weeks
-    predicted_cases = recent.tail(4)['cases'].mean()
+    # Columns assembled in one pass, regions joined from the static lookup
+    districts = district_predictions.index.astype(str)
     
-    # Adjust for trend
-    if len(recent) >= 8:
-        older_avg = recent.head(4)['cases'].mean()
-        newer_avg = recent.tail(4)['cases'].mean()
-        trend = newer_avg - older_avg
-        predicted_cases += (trend * 0.5)  # Half the trend
+    predictions_df = pd.DataFrame({
+        'District': districts,
+        'Region': district_region_lookup().reindex(districts).to_numpy(),
+        'Predicted Cases': district_predictions.to_numpy(dtype=float).round(1),
+        'Risk Level': pd.Categorical(risk_levels, categories=RISK_LEVEL_ORDER, ordered=True),
+        'Risk Class': risk_classes,
+        'Risk Color': risk_colors
+    })
     
-    return max(0, predicted_cases)  # No negative predictions
+    return predictions_df
 
 
-def classify_risk_level(predicted_cases, historical_data):
-    """
-    Classify outbreak risk based on predicted cases
-    
-    Args:
-        predicted_cases: Predicted number of cases
-        historical_data: Historical data for threshold calculation
-        
-    Returns:
-        Risk level and color
-    """
-    # Calculate thresholds
-    p90 = historical_data['cases'].quantile(0.90)
-    p75 = historical_data['cases'].quantile(0.75)
-    p50 = historical_data['cases'].quantile(0.50)
-    
-    if predicted_cases > p90:
-        return "🔴 Critical", "risk-critical", "#DC3545"
-    elif predicted_cases > p75:
-        return "🟠 High", "risk-high", "#FFC107"
-    elif predicted_cases > p50:
-        return "🟡 Moderate", "risk-moderate", "#17A2B8"
-    else:
-        return "🟢 Low", "risk-low", "#28A745"
+@st.cache_data(ttl=3600)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """UTF-8 CSV for the download button, encoded once per table contents"""
+    return df.to_csv(index=False).encode('utf-8')
 
 
 # ============================================================================
@@ -329,10 +462,12 @@ def main():
     # ========================================================================
     
     with st.spinner("Loading data and models..."):
-        df = load_main_dataset()
+        df = load_prediction_data()
         regression_model = load_ml_model('regression')
-        classification_model = load_ml_model('classification')
-        scaler = load_feature_scaler()
+        model_available = regression_model is not None
+        # Classifier and scaler are only used alongside the regression model
+        classification_model = load_ml_model('classification') if model_available else None
+        scaler = load_feature_scaler() if model_available else None
     
     if df.empty:
         st.error("❌ Failed to load data.")
@@ -342,7 +477,7 @@ def main():
     # MODEL AVAILABILITY CHECK
     # ========================================================================
     
-    if regression_model is None:
+    if not model_available:
         st.info("""
         📊 **Statistical Prediction Mode**
         
@@ -361,10 +496,8 @@ def main():
         If you have trained ML models (XGBoost/LightGBM), place them in:
         `cleaned_data/model_results/` for more sophisticated predictions.
         """)
-        model_available = False
     else:
         st.success("✅ ML models loaded successfully!")
-        model_available = True
     
     # ========================================================================
     # SIDEBAR FILTERS
@@ -395,7 +528,7 @@ def main():
     st.sidebar.markdown("---")
     
     # Region filter
-    available_regions = sorted(df['region'].unique())
+    available_regions = df['region'].cat.categories.sort_values().tolist()
     selected_regions = st.sidebar.multiselect(
         "Filter by Regions",
         options=available_regions,
@@ -414,36 +547,7 @@ def main():
     st.subheader("🔮 District-Level Predictions")
     
     with st.spinner("Generating predictions..."):
-        # Get districts in selected regions
-        districts_to_predict = df[df['region'].isin(selected_regions)]['district_clean'].unique()
-        
-        predictions = []
-        
-        for district in districts_to_predict:
-            # Make prediction (simple statistical method)
-            predicted_cases = make_simple_prediction(df, district, weeks_ahead)
-            
-            if predicted_cases is not None:
-                # Get district info
-                district_data = df[df['district_clean'] == district]
-                region = district_data.iloc[0]['region']
-                
-                # Classify risk
-                risk_level, risk_class, risk_color = classify_risk_level(
-                    predicted_cases, 
-                    district_data
-                )
-                
-                predictions.append({
-                    'District': district,
-                    'Region': region,
-                    'Predicted Cases': round(predicted_cases, 1),
-                    'Risk Level': risk_level,
-                    'Risk Class': risk_class,
-                    'Risk Color': risk_color
-                })
-        
-        predictions_df = pd.DataFrame(predictions)
+        predictions_df = build_predictions(tuple(sorted(selected_regions)), weeks_ahead)
     
     if predictions_df.empty:
         st.warning("⚠️ No predictions available for selected regions.")
@@ -460,6 +564,9 @@ def main():
     
     sum_col1, sum_col2, sum_col3, sum_col4 = st.columns(4)
     
+    # Districts per risk level, counted in one pass
+    risk_counts = predictions_df['Risk Level'].value_counts()
+    
     with sum_col1:
         total_predicted = predictions_df['Predicted Cases'].sum()
         st.metric(
@@ -469,7 +576,7 @@ def main():
         )
     
     with sum_col2:
-        critical_districts = (predictions_df['Risk Level'] == '🔴 Critical').sum()
+        critical_districts = int(risk_counts.get('🔴 Critical', 0))
         st.metric(
             "Critical Risk Districts",
             critical_districts,
@@ -477,7 +584,7 @@ def main():
         )
     
     with sum_col3:
-        high_risk_districts = (predictions_df['Risk Level'] == '🟠 High').sum()
+        high_risk_districts = int(risk_counts.get('🟠 High', 0))
         st.metric(
             "High Risk Districts",
             high_risk_districts,
@@ -485,7 +592,7 @@ def main():
         )
     
     with sum_col4:
-        low_risk_districts = (predictions_df['Risk Level'] == '🟢 Low').sum()
+        low_risk_districts = int(risk_counts.get('🟢 Low', 0))
         st.metric(
             "Low Risk Districts",
             low_risk_districts,
@@ -501,26 +608,28 @@ def main():
     st.subheader("🗺️ Risk Classification Map")
     
     # Create bar chart showing top 20 districts by predicted cases
-    fig_risk = px.bar(
-        predictions_df.head(20),
-        x='Predicted Cases',
-        y='District',
-        color='Risk Level',
-        color_discrete_map={
-            '🔴 Critical': '#DC3545',
-            '🟠 High': '#FFC107',
-            '🟡 Moderate': '#17A2B8',
-            '🟢 Low': '#28A745'
-        },
-        title=f"<b>Top 20 Districts by Predicted Cases (Next {weeks_ahead} Weeks)</b>",
-        labels={'Predicted Cases': 'Predicted Cases', 'District': 'District'},
-        hover_data=['Region'],
-        orientation='h'
-    )
+    top_20 = predictions_df.head(20)
+    
+    fig_risk = go.Figure(go.Bar(
+        x=top_20['Predicted Cases'],
+        y=top_20['District'],
+        orientation='h',
+        marker=dict(color=top_20['Risk Color']),
+        customdata=top_20[['Region', 'Risk Level']].to_numpy(),
+        hovertemplate=(
+            'District=%{y}<br>'
+            'Predicted Cases=%{x}<br>'
+            'Region=%{customdata[0]}<br>'
+            'Risk Level=%{customdata[1]}<extra></extra>'
+        )
+    ))
     
     fig_risk.update_layout(
+        title=f"<b>Top 20 Districts by Predicted Cases (Next {weeks_ahead} Weeks)</b>",
+        xaxis_title='Predicted Cases',
+        yaxis_title='District',
         height=600,
-        showlegend=True,
+        showlegend=False,
         yaxis={'categoryorder': 'total ascending'}
     )
     
@@ -556,7 +665,7 @@ def main():
     )
     
     # Download button
-    csv_data = predictions_df.to_csv(index=False).encode('utf-8')
+    csv_data = to_csv_bytes(predictions_df)
     st.download_button(
         label="📥 Download Predictions (CSV)",
         data=csv_data,
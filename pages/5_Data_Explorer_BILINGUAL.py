@@ -32,6 +32,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lang_config import get_text
+from data_loader import load_main_dataset, category_code_mask
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -62,37 +63,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ============================================================================
-# CACHED DATA LOADING
-# ============================================================================
-
-@st.cache_data(ttl=3600)
-def load_main_dataset():
-    """Load primary dataset"""
-    try:
-        df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-        df['data_year'] = df['data_year'].astype('int16')
-        df['week_number'] = df['week_number'].astype('int8')
-        if 'region' in df.columns:
-            df['region'] = df['region'].astype('category')
-        if 'district_clean' in df.columns:
-            df['district_clean'] = df['district_clean'].astype('category')
-        return df
-    except:
-        try:
-            df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-            df['data_year'] = df['data_year'].astype('int16')
-            df['week_number'] = df['week_number'].astype('int8')
-            if 'region' in df.columns:
-                df['region'] = df['region'].astype('category')
-            if 'district_clean' in df.columns:
-                df['district_clean'] = df['district_clean'].astype('category')
-            return df
-        except Exception as e:
-            st.error(f"{get_text('error_loading_data', lang)}: {str(e)}")
-            return pd.DataFrame()
-
-
 # ============================================================================
 # MAIN PAGE FUNCTION
 # ============================================================================
@@ -168,9 +138,9 @@ def main():
     )
     
     if show_district_filter:
-        available_districts = sorted(
-            df[df['region'].isin(selected_regions)]['district_clean'].unique()
-        )
+        # Districts present in the selected regions, from the category codes
+        district_codes = np.unique(df['district_clean'].array.codes[category_code_mask(df['region'], selected_regions)])
+        available_districts = sorted(df['district_clean'].cat.categories[district_codes[district_codes >= 0]])
         selected_districts = st.sidebar.multiselect(
             get_text('districts', lang),
             options=available_districts,
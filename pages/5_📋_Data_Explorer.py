@@ -21,10 +21,17 @@ Target Audience: Researchers, analysts needing custom data queries
 import streamlit as st
 import pandas as pd
 import numpy as np
+import io
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+# Shared dataset loader (one cache entry across pages)
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import load_main_dataset, category_code_mask
+
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
@@ -52,24 +59,113 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ============================================================================
-# CACHED DATA LOADING
+# CACHED FILTERING, FILTER OPTIONS & EXPORTS
 # ============================================================================
 
 @st.cache_data(ttl=3600)
-def load_main_dataset():
-    """Load primary dataset"""
-    try:
-        df = pd.read_csv('cleaned_data/ml_final_100pct_geometry.csv')
-        df['data_year'] = df['data_year'].astype('int16')
-        df['week_number'] = df['week_number'].astype('int8')
-        if 'region' in df.columns:
-            df['region'] = df['region'].astype('category')
-        if 'district_clean' in df.columns:
-            df['district_clean'] = df['district_clean'].astype('category')
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return pd.DataFrame()
+def get_filter_options():
+    """
+    Sidebar choices: sorted years, regions and each region's districts
+    
+    Regions come from the (sorted) category index; the region -> districts
+    map replaces a full-frame filter + unique() on every sidebar rerun.
+    """
+    df = load_main_dataset()
+    available_years = sorted(df['data_year'].unique().tolist())
+    available_regions = df['region'].cat.categories.sort_values().tolist()
+    districts_by_region = {
+        region: districts.tolist()
+        for region, districts in df.groupby('region', observed=True)['district_clean'].unique().items()
+    }
+    return available_years, available_regions, districts_by_region
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def apply_filters(years: tuple, week_range: tuple, regions: tuple, districts: tuple,
+                  cases_filter: str, cases_min=None, cases_max=None) -> pd.DataFrame:
+    """
+    Rows of the main dataset matching the sidebar filters
+    
+    Cached on the filter values, so reruns from the column selector, row
+    slider or export buttons reuse the filtered frame. The dataset itself
+    comes from the cached loader rather than being hashed as an argument.
+    """
+    df = load_main_dataset()
+    
+    # One combined row mask, applied to the frame once
+    mask = np.ones(len(df), dtype=bool)
+    
+    # Year filter
+    if years:
+        mask &= np.isin(df['data_year'].to_numpy(), np.array(years))
+    
+    # Week range (the full 1-53 range keeps every week)
+    if tuple(week_range) != (1, 53):
+        weeks = df['week_number'].to_numpy()
+        mask &= (weeks >= week_range[0]) & (weeks <= week_range[1])
+    
+    # Region filter
+    if regions:
+        mask &= category_code_mask(df['region'], regions)
+    
+    # District filter (if enabled)
+    if districts:
+        mask &= category_code_mask(df['district_clean'], districts)
+    
+    # Cases filter
+    cases = df['cases'].to_numpy()
+    if cases_filter == "Only records with cases (>0)":
+        mask &= cases > 0
+    elif cases_filter == "Custom range":
+        mask &= (cases >= cases_min) & (cases <= cases_max)
+    
+    return df.loc[mask]
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def filtered_csv_bytes(filters: tuple, columns: tuple) -> bytes:
+    """UTF-8 CSV of the filtered rows, cached on the filters and columns"""
+    csv_buffer = io.BytesIO()
+    # to_csv writes just the chosen columns, without a projected copy first
+    apply_filters(*filters).to_csv(csv_buffer, columns=list(columns), index=False, encoding='utf-8')
+    return csv_buffer.getvalue()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def filtered_parquet_bytes(filters: tuple, columns: tuple) -> bytes:
+    """Snappy-compressed Parquet of the filtered rows (keeps column dtypes)"""
+    parquet_buffer = io.BytesIO()
+    apply_filters(*filters)[list(columns)].to_parquet(
+        parquet_buffer, engine='pyarrow', compression='snappy', index=False
+    )
+    return parquet_buffer.getvalue()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def summary_csv_bytes(filters: tuple, columns: tuple) -> bytes:
+    """UTF-8 CSV of describe() over the filtered numeric columns"""
+    return apply_filters(*filters)[list(columns)].describe().to_csv().encode('utf-8')
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_recent_outbreaks():
+    """
+    Records with cases in the last 4 weeks of the most recent year
+    
+    The latest (year, week) is found in one pass as the max of a packed
+    year * 100 + week key, then a single mask selects the rows.
+    """
+    df = load_main_dataset()
+    years = df['data_year'].to_numpy()
+    weeks = df['week_number'].to_numpy()
+    
+    max_year, max_week = divmod(int((years.astype(np.int32) * 100 + weeks).max()), 100)
+    
+    return df.loc[
+        (years == max_year) &
+        (weeks > max_week - 4) &
+        (df['cases'].to_numpy() > 0)
+    ]
 
 
 # ============================================================================
@@ -107,9 +203,10 @@ def main():
     st.sidebar.header("🔍 Advanced Filters")
     st.sidebar.markdown("---")
     
+    available_years, available_regions, districts_by_region = get_filter_options()
+    
     # Year filter
     st.sidebar.subheader("📅 Time Period")
-    available_years = sorted(df['data_year'].unique())
     selected_years = st.sidebar.multiselect(
         "Years",
         options=available_years,
@@ -130,7 +227,6 @@ def main():
     
     # Region filter
     st.sidebar.subheader("🌍 Geographic")
-    available_regions = sorted(df['region'].unique())
     selected_regions = st.sidebar.multiselect(
         "Regions",
         options=available_regions,
@@ -143,9 +239,9 @@ def main():
     
     if show_district_filter:
         # Only show districts from selected regions
-        available_districts = sorted(
-            df[df['region'].isin(selected_regions)]['district_clean'].unique()
-        )
+        available_districts = sorted(set().union(
+            *(districts_by_region.get(region, []) for region in selected_regions)
+        ))
         selected_districts = st.sidebar.multiselect(
             "Districts",
             options=available_districts,
@@ -174,35 +270,21 @@ def main():
     # APPLY FILTERS
     # ========================================================================
     
-    # Start with full dataset
-    df_filtered = df.copy()
-    
-    # Apply year filter
-    if selected_years:
-        df_filtered = df_filtered[df_filtered['data_year'].isin(selected_years)]
-    
-    # Apply week range
-    df_filtered = df_filtered[
-        (df_filtered['week_number'] >= week_range[0]) &
-        (df_filtered['week_number'] <= week_range[1])
-    ]
-    
-    # Apply region filter
-    if selected_regions:
-        df_filtered = df_filtered[df_filtered['region'].isin(selected_regions)]
-    
-    # Apply district filter (if enabled)
-    if show_district_filter and selected_districts:
-        df_filtered = df_filtered[df_filtered['district_clean'].isin(selected_districts)]
-    
-    # Apply cases filter
-    if cases_filter == "Only records with cases (>0)":
-        df_filtered = df_filtered[df_filtered['cases'] > 0]
-    elif cases_filter == "Custom range":
-        df_filtered = df_filtered[
-            (df_filtered['cases'] >= cases_min) &
-            (df_filtered['cases'] <= cases_max)
-        ]
+    # Selecting every year/region filters nothing, so it is passed as no
+    # filter (the mask is then skipped and shares the unfiltered cache entry)
+    all_years = len(selected_years) == len(available_years)
+    all_regions = len(selected_regions) == len(available_regions)
+    
+    filters = (
+        () if all_years else tuple(sorted(selected_years)),
+        tuple(week_range),
+        () if all_regions else tuple(sorted(selected_regions)),
+        tuple(sorted(selected_districts)) if show_district_filter else (),
+        cases_filter,
+        cases_min if cases_filter == "Custom range" else None,
+        cases_max if cases_filter == "Custom range" else None
+    )
+    df_filtered = apply_filters(*filters)
     
     # ========================================================================
     # FILTER SUMMARY
@@ -212,6 +294,11 @@ def main():
     
     col1, col2, col3, col4, col5 = st.columns(5)
     
+    # Summary reductions computed together rather than one scan per tile
+    totals = df_filtered[['cases', 'deaths']].sum()
+    year_span = df_filtered['data_year'].agg(['min', 'max'])
+    district_count = df_filtered['district_clean'].cat.remove_unused_categories().cat.categories.size
+    
     with col1:
         st.metric(
             "Total Records",
@@ -223,28 +310,28 @@ def main():
     with col2:
         st.metric(
             "Total Cases",
-            f"{df_filtered['cases'].sum():,.0f}",
+            f"{totals['cases']:,.0f}",
             help="Sum of all cases in filtered data"
         )
     
     with col3:
         st.metric(
             "Total Deaths",
-            f"{df_filtered['deaths'].sum():,.0f}",
+            f"{totals['deaths']:,.0f}",
             help="Sum of all deaths in filtered data"
         )
     
     with col4:
         st.metric(
             "Districts",
-            df_filtered['district_clean'].nunique(),
+            district_count,
             help="Number of unique districts"
         )
     
     with col5:
         st.metric(
             "Date Range",
-            f"{df_filtered['data_year'].min()}-{df_filtered['data_year'].max()}",
+            f"{year_span['min']}-{year_span['max']}",
             help="Year range in filtered data"
         )
     
@@ -275,18 +362,34 @@ def main():
         st.warning("⚠️ Please select at least one column to display.")
         st.stop()
     
-    # Limit rows for performance
-    max_rows = st.slider(
-        "Maximum rows to display",
-        min_value=100,
-        max_value=min(10000, len(df_filtered)),
-        value=min(1000, len(df_filtered)),
-        step=100,
-        help="Displaying too many rows may slow down the browser"
-    )
+    # Paginate: only one page of rows is sliced and sent to the browser
+    page_col1, page_col2 = st.columns(2)
+    
+    with page_col1:
+        page_size = st.select_slider(
+            "Rows per page",
+            options=[50, 100, 200, 500],
+            value=100,
+            help="Displaying too many rows may slow down the browser"
+        )
+    
+    total_pages = max(1, -(-len(df_filtered) // page_size))
+    
+    with page_col2:
+        page = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            help=f"{total_pages:,} pages"
+        )
     
     # Display table
-    df_display = df_filtered[selected_columns].head(max_rows)
+    page_start = (page - 1) * page_size
+    df_display = df_filtered.iloc[
+        page_start:page_start + page_size,
+        df_filtered.columns.get_indexer(selected_columns)
+    ]
     
     st.dataframe(
         df_display,
@@ -294,8 +397,11 @@ def main():
         height=500
     )
     
-    if len(df_filtered) > max_rows:
-        st.info(f"ℹ️ Showing {max_rows:,} of {len(df_filtered):,} records. Adjust slider to show more.")
+    if total_pages > 1:
+        st.info(
+            f"ℹ️ Showing records {page_start + 1:,}-{page_start + len(df_display):,} "
+            f"of {len(df_filtered):,} (page {page:,} of {total_pages:,})."
+        )
     
     st.markdown("---")
     
@@ -315,17 +421,20 @@ def main():
             index=numeric_cols.index('cases') if 'cases' in numeric_cols else 0
         )
         
-        # Calculate statistics
+        # Calculate statistics (describe() gives all but the sum; its 50%
+        # quantile is the median)
+        stat_values = df_filtered[selected_stat_col]
+        described = stat_values.describe()
         stats_data = {
             'Statistic': ['Count', 'Mean', 'Median', 'Std Dev', 'Min', 'Max', 'Sum'],
             'Value': [
-                f"{df_filtered[selected_stat_col].count():,.0f}",
-                f"{df_filtered[selected_stat_col].mean():.2f}",
-                f"{df_filtered[selected_stat_col].median():.2f}",
-                f"{df_filtered[selected_stat_col].std():.2f}",
-                f"{df_filtered[selected_stat_col].min():.2f}",
-                f"{df_filtered[selected_stat_col].max():.2f}",
-                f"{df_filtered[selected_stat_col].sum():,.0f}"
+                f"{described['count']:,.0f}",
+                f"{described['mean']:.2f}",
+                f"{described['50%']:.2f}",
+                f"{described['std']:.2f}",
+                f"{described['min']:.2f}",
+                f"{described['max']:.2f}",
+                f"{stat_values.sum():,.0f}"
             ]
         }
         
@@ -344,22 +453,37 @@ def main():
     export_col1, export_col2 = st.columns(2)
     
     with export_col1:
-        # Export filtered data
-        csv_data = df_filtered[selected_columns].to_csv(index=False).encode('utf-8')
-        
-        st.download_button(
-            label="📥 Download Filtered Data (CSV)",
-            data=csv_data,
-            file_name=f"meningitis_filtered_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            mime="text/csv",
-            help="Download the current filtered dataset"
+        export_format = st.radio(
+            "Export format",
+            options=["CSV", "Parquet"],
+            horizontal=True,
+            help="Parquet is much smaller and faster to load for large exports"
         )
+        
+        # Export filtered data (encoded once per filters/columns, not per rerun)
+        file_stamp = f"meningitis_filtered_{datetime.now().strftime('%Y%m%d_%H%M')}"
+        
+        if export_format == "Parquet":
+            st.download_button(
+                label="📥 Download Filtered Data (Parquet)",
+                data=filtered_parquet_bytes(filters, tuple(selected_columns)),
+                file_name=f"{file_stamp}.parquet",
+                mime="application/octet-stream",
+                help="Download the current filtered dataset"
+            )
+        else:
+            st.download_button(
+                label="📥 Download Filtered Data (CSV)",
+                data=filtered_csv_bytes(filters, tuple(selected_columns)),
+                file_name=f"{file_stamp}.csv",
+                mime="text/csv",
+                help="Download the current filtered dataset"
+            )
     
     with export_col2:
         # Export summary statistics
         if numeric_cols:
-            summary_stats = df_filtered[numeric_cols].describe()
-            summary_csv = summary_stats.to_csv().encode('utf-8')
+            summary_csv = summary_csv_bytes(filters, tuple(numeric_cols))
             
             st.download_button(
                 label="📊 Download Summary Statistics (CSV)",
@@ -391,13 +515,7 @@ def main():
     
     with query_col2:
         if st.button("📈 Recent Outbreaks (Last 4 weeks)"):
-            max_year = df['data_year'].max()
-            max_week = df[df['data_year'] == max_year]['week_number'].max()
-            recent = df[
-                (df['data_year'] == max_year) &
-                (df['week_number'] > max_week - 4) &
-                (df['cases'] > 0)
-            ]
+            recent = get_recent_outbreaks()
             if not recent.empty:
                 st.write(f"Found {len(recent)} records")
                 st.dataframe(recent.head(20))
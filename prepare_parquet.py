@@ -0,0 +1,127 @@
+"""
+================================================================================
+PARQUET PREPARATION - ONE-SHOT PREPROCESSING STEP
+================================================================================
+
+Converts the primary dataset (ml_final_100pct_geometry.csv) to a typed,
+columnar Parquet sibling that the dashboard pages load instead of re-parsing
+the CSV on every cache expiry, materializes the per-district historical
+case percentiles used by the Predictions page risk classification, and
+writes the simplified district polygons drawn by the Spatial Analysis map.
+
+Run once (and again whenever the CSV is regenerated):
+    python prepare_parquet.py
+
+The dashboard falls back to the CSV automatically if the Parquet is missing,
+and to simplifying the full GeoJSON on load if the simplified one is missing.
+
+================================================================================
+"""
+
+import os
+
+import pandas as pd
+
+# GeoPandas is optional: without it the simplified GeoJSON is not written
+try:
+    import geopandas as gpd
+    GEOPANDAS_AVAILABLE = True
+except ImportError:
+    GEOPANDAS_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DATA_DIR = 'cleaned_data'
+CSV_PATH = os.path.join(DATA_DIR, 'ml_final_100pct_geometry.csv')
+PARQUET_PATH = os.path.join(DATA_DIR, 'ml_final_100pct_geometry.parquet')
+QUANTILES_PATH = os.path.join(DATA_DIR, 'district_quantiles.parquet')
+GEOJSON_PATH = os.path.join(DATA_DIR, 'cameroon_districts_matched.geojson')
+SIMPLIFIED_GEOJSON_PATH = os.path.join(DATA_DIR, 'cameroon_districts_simplified.geojson')
+
+# Simplification tolerance in degrees (~500 m); invisible at country zoom
+SIMPLIFY_TOLERANCE = 0.005
+
+# Dtypes persisted in the Parquet schema so pages no longer cast after loading
+DTYPES = {
+    'data_year': 'int16',
+    'week_number': 'int8',
+    'region': 'category',
+    'district_clean': 'category'
+}
+
+ROW_GROUP_SIZE = 128_000
+
+
+# ============================================================================
+# CONVERSION
+# ============================================================================
+
+def convert_main_dataset():
+    """Write the main dataset to Parquet with its dashboard dtypes applied"""
+    df = pd.read_csv(CSV_PATH, engine='pyarrow')
+    df = df.astype(DTYPES)
+
+    df.to_parquet(
+        PARQUET_PATH,
+        engine='pyarrow',
+        index=False,
+        compression='zstd',
+        row_group_size=ROW_GROUP_SIZE
+    )
+
+    csv_mb = os.path.getsize(CSV_PATH) / 1e6
+    parquet_mb = os.path.getsize(PARQUET_PATH) / 1e6
+    print(f"✅ {PARQUET_PATH}: {len(df):,} rows "
+          f"({csv_mb:.1f} MB CSV -> {parquet_mb:.1f} MB Parquet)")
+
+    return df
+
+
+def write_district_quantiles(df):
+    """Write each district's p50/p75/p90 weekly cases (risk thresholds)"""
+    quantiles = df.groupby('district_clean', observed=True)['cases'].quantile(
+        [0.50, 0.75, 0.90]
+    ).unstack()
+    quantiles.columns = ['p50', 'p75', 'p90']
+    quantiles.index = quantiles.index.astype(str)
+
+    quantiles.to_parquet(QUANTILES_PATH, engine='pyarrow', compression='zstd')
+
+    print(f"✅ {QUANTILES_PATH}: {len(quantiles):,} districts")
+
+
+def write_simplified_geojson():
+    """
+    Write the district polygons simplified as one coverage
+    
+    simplify_coverage moves each shared border once for both neighbours,
+    so unlike per-polygon simplify() it leaves no slivers or gaps between
+    districts. Needs GeoPandas >= 1.1 (Shapely >= 2.1, GEOS >= 3.12).
+    """
+    if not GEOPANDAS_AVAILABLE:
+        print(f"⚠️ GeoPandas not available: {SIMPLIFIED_GEOJSON_PATH} not written")
+        return
+    
+    gdf = gpd.read_file(GEOJSON_PATH, columns=['district_clean'])[['district_clean', 'geometry']]
+    
+    if not hasattr(gdf.geometry, 'simplify_coverage'):
+        print(f"⚠️ GeoPandas >= 1.1 required: {SIMPLIFIED_GEOJSON_PATH} not written")
+        return
+    
+    # Coverage simplification needs valid polygons (no collapsed parts)
+    geometry = gdf.geometry.make_valid(method='structure', keep_collapsed=False)
+    gdf['geometry'] = geometry.simplify_coverage(tolerance=SIMPLIFY_TOLERANCE)
+    
+    gdf.to_file(SIMPLIFIED_GEOJSON_PATH, driver='GeoJSON', COORDINATE_PRECISION=5)
+    
+    full_mb = os.path.getsize(GEOJSON_PATH) / 1e6
+    simplified_mb = os.path.getsize(SIMPLIFIED_GEOJSON_PATH) / 1e6
+    print(f"✅ {SIMPLIFIED_GEOJSON_PATH}: {len(gdf):,} districts "
+          f"({full_mb:.1f} MB -> {simplified_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    write_district_quantiles(convert_main_dataset())
+    write_simplified_geojson()